@@ -16,6 +16,7 @@ TEST="🧪"
 VENV_NAME=".venv"
 TEST_DIR="src/tests"
 VERBOSE_FLAG=""
+PARALLEL_FLAG=""
 TARGET_PATH="$TEST_DIR"
 
 # Parse arguments
@@ -25,6 +26,12 @@ while [[ $# -gt 0 ]]; do
       VERBOSE_FLAG="--log-cli-level=DEBUG"
       shift
       ;;
+    -j|--parallel)
+      # Needs pytest-xdist; fixtures keep per-test files under tmp_path.
+      # loadfile keeps each module on one worker so module fixtures are reused
+      PARALLEL_FLAG="-n auto --dist loadfile"
+      shift
+      ;;
     *)
       TARGET_PATH="$1"
       shift
@@ -44,7 +51,7 @@ source "$VENV_NAME/bin/activate"
 
 # Run pytest with PYTHONPATH set
 echo -e "${TEST} Running tests in ${YELLOW}${TARGET_PATH}${RESET}..."
-PYTHONPATH=$(pwd) pytest -v $VERBOSE_FLAG "$TARGET_PATH"
+PYTHONPATH=$(pwd) pytest -v $VERBOSE_FLAG $PARALLEL_FLAG "$TARGET_PATH"
 
 # Check exit status
 if [ $? -eq 0 ]; then
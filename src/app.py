@@ -4,6 +4,8 @@ Main Application Entry Point.
 This module initializes and runs the BibInject application.
 """
 
+import sys
+
 # Local Imports
 from src import __version__, __author__
 from src.cli import run_cli
@@ -13,6 +15,11 @@ def main():
     """
     Entry point for application logic.
     """
+    # Answer --version before the CLI (argparse, logging) is built
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(f"BibInject v{__version__}")
+        return
+
     print(f"BibInject v{__version__} by {__author__}\n")
     run_cli()
 
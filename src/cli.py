@@ -1,24 +1,39 @@
 import argparse
+import sys
+from functools import lru_cache
 from .error_handler import ErrorHandler
-from .injector import Injector
-from .web import run_web
 
-# Initialize error handler
-error_handler = ErrorHandler()
 
+@lru_cache(maxsize=1)
+def _get_error_handler() -> ErrorHandler:
+    """Build the error handler on first use so `-h` never opens the log file."""
+    return ErrorHandler()
 
-def parse_arguments():
-    parser = argparse.ArgumentParser(
-        description="Inject BibTeX references into an HTML template."
-    )
 
-    # --- WEB MODE (optional, triggers early exit) ---
+def _add_web_argument(parser):
     parser.add_argument(
         "--web",
         action="store_true",
         help="Start the BibInject web interface.",
     )
 
+
+def _web_parser():
+    parser = argparse.ArgumentParser(
+        description="Start the BibInject web interface."
+    )
+    _add_web_argument(parser)
+    return parser
+
+
+def _cli_parser():
+    parser = argparse.ArgumentParser(
+        description="Inject BibTeX references into an HTML template."
+    )
+
+    # --- WEB MODE (optional, triggers early exit) ---
+    _add_web_argument(parser)
+
     # --- CLI MODE ARGS (no longer required=True here) ---
     parser.add_argument("--input", help="Path to the BibTeX input file (.bib).")
     parser.add_argument(
@@ -56,26 +71,42 @@ def parse_arguments():
         help="Output HTML file path where the final injected HTML will be written.",
     )
 
+    return parser
 
-    return parser.parse_args()
+
+def parse_arguments():
+    # Web mode ignores every other argument, so skip building the CLI parser
+    if "--web" in sys.argv[1:]:
+        args, _ = _web_parser().parse_known_args()
+        return args
+
+    return _cli_parser().parse_args()
 
 
-@error_handler.handle
 def run_cli():
+    # argparse exits on -h/usage errors before the logger is configured
     args = parse_arguments()
+    return _get_error_handler().handle(_run)(args)
+
 
+def _run(args):
     # If --web is set, ignore all other arguments and start the web server
     if args.web:
+        # Flask is only imported when the web interface is requested
+        from .web import run_web
+
         print("Starting BibInject web interface on http://127.0.0.1:6969 ...")
         return run_web()
 
+    # Deferred so that argument errors don't pay for the pipeline imports
+    from pathlib import Path
+    from .injector import Injector
+
     # ---- Load template HTML ----
-    with open(args.html, "r", encoding="utf-8") as f:
-        html_text = f.read()
+    html_text = Path(args.html).read_text(encoding="utf-8")
 
     # ---- Load BibTeX file ----
-    with open(args.input, "r", encoding="utf-8") as f:
-        bib_text = f.read()
+    bib_text = Path(args.input).read_text(encoding="utf-8")
 
     # ---- Run the unified pipeline ----
     output_html = Injector.run_injection_pipeline(
@@ -85,7 +116,7 @@ def run_cli():
         order=args.order,
         group=args.group,
         target_id=args.target_id,
-        doi_icon=None if args.doi_icon.lower() == "none" else args.doi_icon,
+        doi_icon=args.doi_icon,
     )
 
     # If pipeline returned an error, show it
@@ -94,7 +125,6 @@ def run_cli():
         return
 
     # ---- Save output ----
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(output_html)
+    Path(args.output).write_bytes(output_html.encode("utf-8"))
 
     print(f"Injected HTML saved to {args.output}")
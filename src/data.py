@@ -1,24 +1,27 @@
 import os
-import glob
 from dataclasses import dataclass, field
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REFSPEC_DIR = os.path.join(BASE_DIR, "..", "refspec")
+REFSPEC_EXT = ".html"
 
 
+@lru_cache(maxsize=1)
 def load_styles() -> List[str]:
     """
     Reads refspec/*.html and returns a list of filenames without extension.
+    The directory is scanned once per process.
     """
-    pattern = os.path.join(REFSPEC_DIR, "*.html")
-    files = glob.glob(pattern)
-
-    return [
-        os.path.splitext(os.path.basename(f))[0]
-        for f in files
-    ]
+    ext_len = len(REFSPEC_EXT)
+    with os.scandir(REFSPEC_DIR) as it:
+        return [
+            entry.name[:-ext_len]
+            for entry in it
+            if entry.is_file() and entry.name.endswith(REFSPEC_EXT)
+        ]
 
 
 @dataclass
@@ -26,6 +29,13 @@ class UIData:
     """
     Stores all values needed to populate the web interface.
     """
-    styles: List[str] = field(default_factory=load_styles)
+    _styles: Optional[List[str]] = field(default=None, repr=False)
     order_options: List[str] = field(default_factory=lambda: ["asc", "desc"])
     group_options: List[str] = field(default_factory=lambda: ["year", "month", "author"])
+
+    @property
+    def styles(self) -> List[str]:
+        """Available refspec styles, loaded on first access."""
+        if self._styles is None:
+            self._styles = load_styles()
+        return self._styles
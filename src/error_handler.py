@@ -3,92 +3,79 @@ import sys
 from typing import Callable, Any, Optional
 
 
-class TemplateNotFoundError(Exception):
-    """Raised when the specified HTML template cannot be found."""
+class BibInjectError(Exception):
+    """Base class for the known BibInject errors, each with a default message."""
+
+    default_message: str = "An error occurred."
 
     def __init__(self, message: Optional[str] = None):
-        default: str = "HTML template file was not found."
-        super().__init__(message or default)
+        super().__init__(message or self.default_message)
+
+
+class TemplateNotFoundError(BibInjectError):
+    """Raised when the specified HTML template cannot be found."""
 
+    default_message = "HTML template file was not found."
 
-class TemplateReadError(Exception):
+
+class TemplateReadError(BibInjectError):
     """Raised when the specified HTML template has an error at reading."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "Failed to read HTML template content."
-        super().__init__(message or default)
+    default_message = "Failed to read HTML template content."
 
 
-class HTMLElementNotFoundError(Exception):
+class HTMLElementNotFoundError(BibInjectError):
     """Raised when the target HTML element is not found in the HTML content."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "Target HTML element was not found in the HTML."
-        super().__init__(message or default)
+    default_message = "Target HTML element was not found in the HTML."
 
 
-class InjectionError(Exception):
+class InjectionError(BibInjectError):
     """Raised when an error occurs during the injection of BibTeX data into the HTML."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "Failed to inject BibTeX content into the HTML."
-        super().__init__(message or default)
+    default_message = "Failed to inject BibTeX content into the HTML."
 
 
-class ParsingError(Exception):
+class ParsingError(BibInjectError):
     """Raised when an error occurs while attempting to parse a file."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "An error occurred while parsing the file."
-        super().__init__(message or default)
+    default_message = "An error occurred while parsing the file."
 
 
-class OrderingError(Exception):
+class OrderingError(BibInjectError):
     """Raised when an error occurs while attempting to order a entry group."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "An error occurred while ordering entry group."
-        super().__init__(message or default)
+    default_message = "An error occurred while ordering entry group."
 
 
-class GroupingError(Exception):
+class GroupingError(BibInjectError):
     """Raised when an error occurs while attempting to group a entry group."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "An error occurred while grouping entry group."
-        super().__init__(message or default)
+    default_message = "An error occurred while grouping entry group."
 
 
-class FileNotFoundError(Exception):
+class FileNotFoundError(BibInjectError):
     """Raised when an error occurs when file is not found."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "File not found."
-        super().__init__(message or default)
+    default_message = "File not found."
 
 
-class FileWriteError(Exception):
+class FileWriteError(BibInjectError):
     """Raised when an error occurs while attempting to write to a file."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "An error occurred while writing to the file."
-        super().__init__(message or default)
+    default_message = "An error occurred while writing to the file."
 
 
-class FileReadError(Exception):
+class FileReadError(BibInjectError):
     """Raised when an error occurs while attempting to read a file."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "An error occurred while reading the file."
-        super().__init__(message or default)
+    default_message = "An error occurred while reading the file."
 
 
-class EmptyFileError(Exception):
+class EmptyFileError(BibInjectError):
     """Raised when the file passed is empty."""
 
-    def __init__(self, message: Optional[str] = None):
-        default: str = "The file is empty and cannot be processed."
-        super().__init__(message or default)
+    default_message = "The file is empty and cannot be processed."
 
 
 class ErrorHandler:
@@ -98,14 +85,30 @@ class ErrorHandler:
 
     Args:
         log_file (str): Path to the log file. Defaults to '/tmp/BibInject.log'.
+        file_level (int): Minimum level written to the log file. Defaults to INFO.
     """
 
-    def __init__(self, log_file: str = "/tmp/BibInject.log"):
+    def __init__(
+        self, log_file: str = "/tmp/BibInject.log", file_level: int = logging.INFO
+    ):
         self.logger: logging.Logger = logging.getLogger("BibInject")
+        self._log_file: str = log_file
+        self._file_level: int = file_level
+        self._configured: bool = False
+
+    def _ensure_configured(self) -> None:
+        """
+        Attach the file and console handlers on first use, so creating an
+        ErrorHandler at import time doesn't open the log file.
+        """
+        if self._configured:
+            return
+        self._configured = True
         self.logger.setLevel(logging.INFO)
 
         if not self.logger.handlers:
-            handler: logging.FileHandler = logging.FileHandler(log_file)
+            handler: logging.FileHandler = logging.FileHandler(self._log_file)
+            handler.setLevel(self._file_level)
             console: logging.StreamHandler = logging.StreamHandler(sys.stdout)
 
             formatter: logging.Formatter = logging.Formatter(
@@ -131,39 +134,33 @@ class ErrorHandler:
         def wrapper(*args: Any, **kwargs: Any) -> Optional[Any]:
             try:
                 return func(*args, **kwargs)
-            except (
-                TemplateNotFoundError,
-                TemplateReadError,
-                InjectionError,
-                HTMLElementNotFoundError,
-                ParsingError,
-                OrderingError,
-                GroupingError,
-                FileNotFoundError,
-                FileWriteError,
-                FileReadError,
-                EmptyFileError,
-            ) as e:
-                self.logger.error(f"{type(e).__name__}: {e}")
+            except BibInjectError as e:
+                self._ensure_configured()
+                self.logger.error("%s: %s", type(e).__name__, e)
                 return None
             except Exception:
+                self._ensure_configured()
                 self.logger.exception("Unhandled exception occurred")
                 return None
 
         return wrapper
 
-    def info(self, message: str) -> None:
-        """Log an informational message."""
-        self.logger.info(message)
+    def info(self, message: str, *args: Any) -> None:
+        """Log an informational message, %-formatting `args` only if emitted."""
+        self._ensure_configured()
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log a warning message."""
-        self.logger.warning(message)
+        self._ensure_configured()
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log an error message."""
-        self.logger.error(message)
+        self._ensure_configured()
+        self.logger.error(message, *args)
 
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args: Any) -> None:
         """Log an exception message with stack trace."""
-        self.logger.exception(message)
+        self._ensure_configured()
+        self.logger.exception(message, *args)
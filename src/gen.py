@@ -1,8 +1,9 @@
 # Third-Party Library Imports
+from functools import lru_cache
 from pathlib import Path
 import re
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 
 # Local Imports
 from .error_handler import (
@@ -17,6 +18,43 @@ from .error_handler import (
 # Initialize Error Handling
 error_handler = ErrorHandler()
 
+# Precompiled patterns used for every rendered entry
+_RE_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_RE_EMPTY_PAREN = re.compile(r"\(\s*\)")
+_RE_SP_PUNCT = re.compile(r"\s+([,.])")
+_RE_COMMA_COMMA = re.compile(r",\s*,")
+_RE_COMMA_PERIOD = re.compile(r",\s*\.")
+_RE_PERIOD_PERIOD = re.compile(r"\.\s*\.")
+# Any text one of the punctuation passes below would rewrite
+_RE_NEEDS_PUNCT_CLEANUP = re.compile(r"\(\s*\)|\s[,.]|,\s*[,.]|\.\s*\.")
+# Leading/trailing spaces per line, plus all but the last space of a run
+_RE_SPACES = re.compile(r"^[ ]+|[ ]+$|[ ]+(?=[ ])", re.MULTILINE)
+_RE_FIRST_P = re.compile(r"(<p[^>]*>)")
+
+# DOI link markup, with and without an image icon
+_DOI_LINK_ICON_TPL = (
+    '\n<a href="https://doi.org/{doi}" target="_blank" '
+    'class="doi-link" aria-label="View DOI" '
+    'style="display:inline-flex; align-items:center; gap:4px;">'
+    '<img src="{icon}" alt="DOI icon" class="doi-icon"> '
+    "DOI</a>"
+)
+_DOI_LINK_TEXT_TPL = (
+    '\n<a href="https://doi.org/{doi}" target="_blank" '
+    'class="doi-link" aria-label="View DOI" >DOI</a>'
+)
+
+
+@lru_cache(maxsize=32)
+def _splitter_regex(type_: str) -> "re.Pattern[str]":
+    """Compiles the <p id="bi-{type_}">...</p> block pattern once per type."""
+    return re.compile(
+        rf'(^[ \t]*<p\s+id="bi-{re.escape(type_)}"[^>]*>\s*\n)'
+        rf"(.*?)"
+        rf"(^[ \t]*</p>)",
+        re.DOTALL | re.MULTILINE,
+    )
+
 
 class Generator:
     """
@@ -57,14 +95,12 @@ class Generator:
             Raises:
                 HTMLElementNotFoundError: If the block is not found.
             """
-            p_pattern = re.compile(
-                rf'(^[ \t]*<p\s+id="bi-{self.type}"[^>]*>\s*\n)'
-                rf"(.*?)"
-                rf"(^[ \t]*</p>)",
-                re.DOTALL | re.MULTILINE,
-            )
-
-            match = re.search(p_pattern, self.html)
+            parts = self._find_split()
+            if parts is not None:
+                return parts
+
+            # Fall back to the regex for layouts the plain scan doesn't cover
+            match = _splitter_regex(self.type).search(self.html)
             if not match:
                 raise HTMLElementNotFoundError(
                     f"Full <p id='bi-{self.type}'> block not found during split."
@@ -72,58 +108,107 @@ class Generator:
 
             return list(match.groups())
 
-    def __init__(self, entry: Dict[str, List[Any]], template_name: str, doi_icon=None):
+        def _find_split(self) -> Optional[List[str]]:
+            """
+            Locates the block with plain string searches. Handles the common
+            layout where the opening <p> starts its own line, has the id as
+            its first attribute, and the closing </p> starts a later line.
+
+            Returns:
+                Optional[List[str]]: The split parts, or None to use the regex.
+            """
+            html = self.html
+            id_pos = html.find(f'id="bi-{self.type}"')
+            if id_pos == -1:
+                return None
+
+            # Opening tag: "<p" + whitespace + id, preceded only by indentation
+            p_pos = html.rfind("<p", 0, id_pos)
+            if p_pos == -1 or not html[p_pos + 2 : id_pos].isspace():
+                return None
+            line_start = html.rfind("\n", 0, p_pos) + 1
+            if html[line_start:p_pos].strip(" \t"):
+                return None
+
+            # The opening part runs through the last newline after the ">"
+            tag_end = html.find(">", id_pos) + 1
+            if tag_end == 0:
+                return None
+            ws_end = tag_end
+            while ws_end < len(html) and html[ws_end].isspace():
+                ws_end += 1
+            newline = html.rfind("\n", tag_end, ws_end)
+            if newline == -1:
+                return None
+            open_end = newline + 1
+
+            # Closing tag: first "</p>" preceded only by indentation
+            close_pos = html.find("</p>", open_end)
+            while close_pos != -1:
+                close_line = html.rfind("\n", open_end, close_pos) + 1 or open_end
+                if not html[close_line:close_pos].strip(" \t"):
+                    return [
+                        html[line_start:open_end],
+                        html[open_end:close_line],
+                        html[close_line : close_pos + 4],
+                    ]
+                close_pos = html.find("</p>", close_pos + 4)
+            return None
+
+    def __init__(
+        self,
+        entry: Optional[Dict[str, Any]],
+        template_name: Union[str, "os.PathLike[str]"],
+        doi_icon=None,
+    ):
         """
         Initializes the Generator instance.
 
         Args:
-            entry (dict): Dictionary containing the bibliographic entry.
-            template_name (str): Name of the HTML template file.
+            entry (dict, optional): Dictionary containing the bibliographic entry.
+                May be None for a generator that only renders via `render`.
+            template_name (str | PathLike): Name or path of the HTML template file.
         """
-        self.data = entry
-        self.template_name = template_name
-        self.type = str(entry["type"])
+        # Kept as str so every template cache sees one key per template
+        self.template_name = os.fspath(template_name)
         self.doi_icon = doi_icon
+        if entry is not None:
+            self._set_entry(entry)
 
-    @error_handler.handle
-    def _load_template(self) -> str:
-        """
-        Loads the HTML template content from the templates folder.
+    def _set_entry(self, entry: Dict[str, Any]) -> None:
+        self.data = entry
+        self.type = str(entry["type"])
 
-        Returns:
-            str: Template content as a string.
+        # Field lookups for placeholders and DOI share one mapping
+        fields = entry["fields"]
+        self._fields_map = fields if isinstance(fields, dict) else dict(fields)
 
-        Raises:
-            FileNotFoundError: If the file does not exist.
-            FileReadError: If the file exists but is not readable.
-            EmptyFileError: If the file exists but is empty.
+    def render(
+        self, entry: Dict[str, Any], prepared: Optional[Sequence[str]] = None
+    ) -> str:
         """
-        template_filename = (
-            self.template_name
-            if self.template_name.endswith(".html")
-            else self.template_name + ".html"
-        )
-        template_path = Path("refspec") / template_filename
-        if not template_path.exists():
-            raise FileNotFoundError(f"File not found: {template_path}")
-
-        if not os.access(template_path, os.R_OK):
-            raise FileReadError(f"File exists but is not readable: {template_path}")
+        Renders another entry with this generator's template and DOI icon,
+        so one Generator can be reused across a whole bibliography.
 
-        with open(template_path, "r", encoding="utf-8") as file:
-            content = file.read().strip()
-
-        if not content:
-            raise EmptyFileError(f"The template file at '{template_path}' is empty.")
+        Args:
+            entry (dict): Dictionary containing the bibliographic entry.
+            prepared (Sequence[str], optional): Parts from `prepare` for the
+                entry's type; looked up when omitted.
 
-        return content
+        Returns:
+            str: The fully rendered and cleaned HTML string.
+        """
+        self._set_entry(entry)
+        if prepared is None:
+            prepared = self.prepare(self.template_name, self.type)
+        return self.render_prepared(prepared)
 
-    def _render(self, elements: List[str]) -> str:
+    def _render(self, elements: Sequence[str]) -> str:
         """
         Renders the HTML template by replacing placeholders with data values.
 
         Args:
-            elements (List[str]): A list with [opening tag, middle content, closing tag].
+            elements (Sequence[str]): [opening tag, middle content, closing tag].
 
         Returns:
             str: Rendered HTML string with placeholders replaced.
@@ -134,16 +219,19 @@ class Generator:
         opening_tag = elements[0]
         middle = elements[1]
         closing_tag = elements[2]
+        fields_map = self._fields_map
 
-        def replacer(match):
-            key = match.group(1).strip()
-            value = dict(self.data["fields"]).get(key)
+        # Odd indexes hold placeholder keys, even indexes the literal text
+        parts = list(_split_placeholders(middle))
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            value = fields_map.get(key)
             if value is None:
-                error_handler.warning(f"Missing value for placeholder '{{{{{key}}}}}'")
-                return ""
-            return value
+                error_handler.warning("Missing value for placeholder '{{%s}}'", key)
+                value = ""
+            parts[i] = value
 
-        middle = re.sub(r"\{\{\s*(\w+)\s*\}\}", replacer, middle)
+        middle = "".join(parts)
         final_middle = self._trim(middle)
         return f"{opening_tag}{final_middle}{closing_tag}"
 
@@ -153,32 +241,57 @@ class Generator:
         punctuation, and excess spaces left after placeholder substitution.
         Preserves line breaks.
 
+        Only passes whose matches cannot interact are fused; the punctuation
+        passes stay sequential because each can create input for the next
+        (e.g. "Name. (). Title" only collapses once the parentheses are gone).
+
         Args:
             text (str): The text to clean.
 
         Returns:
             str: Cleaned text.
         """
-        # Remove empty parentheses like (), ( ), (  )
-        text = re.sub(r"\(\s*\)", "", text)
-
-        # Remove spaces before commas or periods
-        text = re.sub(r"\s+,", ",", text)
-        text = re.sub(r"\s+\.", ".", text)
+        # Fully populated entries usually leave nothing for these passes,
+        # so one search stands in for all of them on the common path
+        if _RE_NEEDS_PUNCT_CLEANUP.search(text):
+            # Remove empty parentheses like (), ( ), (  )
+            text = _RE_EMPTY_PAREN.sub("", text)
 
-        # Remove duplicate or misplaced punctuation
-        text = re.sub(r",\s*,", ",", text)
-        text = re.sub(r",\s*\.", ".", text)
-        text = re.sub(r"\.\s*\.", ".", text)
+            # Remove spaces before commas or periods
+            text = _RE_SP_PUNCT.sub(r"\1", text)
 
-        # Collapse multiple spaces but preserve newlines
-        text = re.sub(r"[ ]{2,}", " ", text)
+            # Remove duplicate or misplaced punctuation
+            text = _RE_COMMA_COMMA.sub(",", text)
+            text = _RE_COMMA_PERIOD.sub(".", text)
+            text = _RE_PERIOD_PERIOD.sub(".", text)
 
-        # Remove leading/trailing spaces on lines but preserve newlines
-        text = re.sub(r"^[ ]+|[ ]+$", "", text, flags=re.MULTILINE)
+        # Collapse multiple spaces and strip lines, preserving newlines
+        text = _RE_SPACES.sub("", text)
 
         return text
 
+    @classmethod
+    def prepare(
+        cls, template_name: Union[str, "os.PathLike[str]"], type_: str
+    ) -> Tuple[str, ...]:
+        """
+        Loads and splits the 'bi-{type_}' block of a template once, so it can
+        be shared by every entry of that type.
+
+        Args:
+            template_name (str | PathLike): Name or path of the HTML template file.
+            type_ (str): The type of entry (e.g., 'article').
+
+        Returns:
+            Tuple[str, ...]: (opening tag, middle content, closing tag)
+
+        Raises:
+            FileNotFoundError: If the template file does not exist.
+            FileReadError: If the file exists but is not readable.
+            EmptyFileError: If the file exists but is empty.
+        """
+        return _split_template(os.fspath(template_name), type_)
+
     def generate_html(self) -> str:
         """
         Generates the final HTML string by loading the template,
@@ -188,37 +301,86 @@ class Generator:
         Returns:
             str: The fully rendered and cleaned HTML string.
         """
-        template_content = self._Splitter(self._load_template(), self.type).split()
-        rendered = self._render(template_content)
+        return self.render_prepared(self.prepare(self.template_name, self.type))
+
+    def render_prepared(self, prepared: Sequence[str]) -> str:
+        """
+        Renders the entry against template parts returned by `prepare`,
+        running only placeholder substitution and DOI insertion.
+
+        Args:
+            prepared (Sequence[str]): [opening tag, middle content, closing tag].
+
+        Returns:
+            str: The fully rendered and cleaned HTML string.
+        """
+        rendered = self._render(prepared)
 
         # Extract DOI
-        fields = dict(self.data["fields"])
-        doi = fields.get("doi")
+        doi = self._fields_map.get("doi")
 
         if not doi:
             return rendered
 
-        if self.doi_icon:  
+        if self.doi_icon:
             # HTML with an image icon
-            doi_link = (
-                f'\n<a href="https://doi.org/{doi}" target="_blank" '
-                f'class="doi-link" aria-label="View DOI" '
-                f'style="display:inline-flex; align-items:center; gap:4px;">'
-                f'<img src="{self.doi_icon}" alt="DOI icon" class="doi-icon"> '
-                f'DOI</a>'
-            )
-
+            doi_link = _DOI_LINK_ICON_TPL.format(doi=doi, icon=self.doi_icon)
         else:
             # Fallback: text-only DOI link
-            doi_link = (
-                f'\n<a href="https://doi.org/{doi}" target="_blank" '
-                f'class="doi-link" aria-label="View DOI" >DOI</a>'
-            )
-
-        rendered = re.sub(
-            r"(<p[^>]*>)",
-            r"\1" + doi_link,
-            rendered,
-            count=1,
-        )
+            doi_link = _DOI_LINK_TEXT_TPL.format(doi=doi)
+
+        # Splice after the first <p> directly: no replacement template to
+        # parse, and backslashes in the link stay literal
+        match = _RE_FIRST_P.search(rendered)
+        if match:
+            end = match.end()
+            rendered = rendered[:end] + doi_link + rendered[end:]
         return rendered
+
+
+@lru_cache(maxsize=None)
+def _load_template_cached(template_name: str) -> str:
+    """
+    Reads a refspec template from disk once per process.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        FileReadError: If the file exists but is not readable.
+        EmptyFileError: If the file exists but is empty.
+    """
+    template_filename = (
+        template_name if template_name.endswith(".html") else template_name + ".html"
+    )
+    template_path = Path("refspec") / template_filename
+    if not template_path.exists():
+        raise FileNotFoundError(f"File not found: {template_path}")
+
+    if not os.access(template_path, os.R_OK):
+        raise FileReadError(f"File exists but is not readable: {template_path}")
+
+    with open(template_path, "r", encoding="utf-8") as file:
+        content = file.read().strip()
+
+    if not content:
+        raise EmptyFileError(f"The template file at '{template_path}' is empty.")
+
+    return content
+
+
+@lru_cache(maxsize=None)
+def _split_template(template_name: str, type_: str) -> Tuple[str, ...]:
+    """
+    Returns the [opening tag, middle content, closing tag] parts of the
+    'bi-{type_}' block, split once per (template, type) pair.
+    """
+    html = _load_template_cached(template_name)
+    return tuple(Generator._Splitter(html, type_).split())
+
+
+@lru_cache(maxsize=None)
+def _split_placeholders(middle: str) -> Tuple[str, ...]:
+    """
+    Splits template content around its {{ key }} placeholders once per
+    template block, alternating literal text and placeholder keys.
+    """
+    return tuple(_RE_PLACEHOLDER.split(middle))
@@ -1,4 +1,7 @@
-from typing import Any, Dict, List, Optional
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from .gen import Generator
 
 # Local Imports
@@ -7,6 +10,57 @@ from .error_handler import ErrorHandler, OrderingError, GroupingError
 # Initialize Error Handling
 error_handler = ErrorHandler()
 
+# BibTeX author separator, in any letter case
+_AND_SPLIT = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+# Month number by BibTeX month name or abbreviation
+_MONTH_MAP: Dict[str, int] = {
+    "jan": 1,
+    "january": 1,
+    "feb": 2,
+    "february": 2,
+    "mar": 3,
+    "march": 3,
+    "apr": 4,
+    "april": 4,
+    "may": 5,
+    "jun": 6,
+    "june": 6,
+    "jul": 7,
+    "july": 7,
+    "aug": 8,
+    "august": 8,
+    "sep": 9,
+    "september": 9,
+    "oct": 10,
+    "october": 10,
+    "nov": 11,
+    "november": 11,
+    "dec": 12,
+    "december": 12,
+}
+
+
+def _last_name(author: str) -> str:
+    """Lowercased last name of one author, "Last, First" or "First Last"."""
+    if "," in author:
+        last = author.split(",", 1)[0]
+    else:
+        parts = author.split()
+        last = parts[-1] if parts else ""
+
+    return last.lower().strip()
+
+
+@lru_cache(maxsize=4096)
+def _primary_last_name(author_field: str) -> str:
+    """
+    Last name of the first author in a BibTeX author string. Cached, since
+    author grouping sorts each entry once for every co-author's bucket.
+    """
+    authors = [a.strip() for a in _AND_SPLIT.split(author_field.strip()) if a.strip()]
+    return _last_name(authors[0]) if authors else ""
+
 
 class GroupHTMLGenerator:
     """
@@ -36,19 +90,36 @@ class GroupHTMLGenerator:
         "December",
         "Unknown",
     ]
+    MONTH_ORDER_INDEX = {month: i for i, month in enumerate(MONTH_ORDER)}
+    # Month name by lowercase 1-3 char prefix; reversed so the first month wins
+    MONTH_PREFIX = {
+        name[:size].lower(): name
+        for name in reversed(MONTH_ORDER[:-1])
+        for size in (1, 2, 3)
+    }
 
     def __init__(self, style, doi_icon="static/doi-icon.svg"):
         self.style = style
         self.doi_icon = None if doi_icon == "None" else doi_icon
+        # Split template parts per entry type, loaded once per distinct type
+        self._prepared: Dict[str, Tuple[str, ...]] = {}
+        self._generator = Generator(None, style, doi_icon=self.doi_icon)
 
     def _render_entry(self, entry):
-        return Generator(entry, self.style, doi_icon=self.doi_icon).generate_html()
+        type_ = str(entry["type"])
+        prepared = self._prepared.get(type_)
+        if prepared is None:
+            prepared = self._prepared[type_] = Generator.prepare(self.style, type_)
+        return self._generator.render(entry, prepared)
 
     def _sort_group_keys(self, keys, reverse):
         """
         Sort group keys (years, authors, etc.) cleanly.
         Numerical years sorted numerically, fallback: string compare.
         """
+        # Plain year keys don't need the per-key try/except below
+        if all(isinstance(k, str) and k.isdecimal() for k in keys):
+            return sorted(keys, key=int, reverse=reverse)
 
         def sort_key(k):
             try:
@@ -61,9 +132,56 @@ class GroupHTMLGenerator:
     def _sort_months(self, months):
         return sorted(
             months,
-            key=lambda m: self.MONTH_ORDER.index(m) if m in self.MONTH_ORDER else 999,
+            key=lambda m: self.MONTH_ORDER_INDEX.get(m, 999),
         )
 
+    @staticmethod
+    def _get_last_name(author_field: Any) -> str:
+        if not author_field:
+            return ""
+
+        if isinstance(author_field, list):
+            return _last_name(author_field[0])
+        return _primary_last_name(str(author_field))
+
+    @classmethod
+    def _year_month_key(cls, entry):
+        fields = entry.get("fields", {})
+        year_raw = fields.get("year", "")
+        # Parsed fields are plain strings; only coerce other types
+        if type(year_raw) is not str:
+            year_raw = str(year_raw)
+        year = int(year_raw) if year_raw.isdigit() else 0
+
+        month_raw = fields.get("month", "")
+        month = _MONTH_MAP.get(month_raw) if type(month_raw) is str else None
+        if month is None:
+            month = cls._month_number(month_raw)
+        return (year, month)
+
+    @classmethod
+    def _month_number(cls, month_raw: Any) -> int:
+        """
+        Calendar index 1-12 of a raw month value, read as group_entries reads
+        it ("3", "Mar", "March", ...), or 0 when unknown.
+        """
+        month_val = str(month_raw).strip().lower()
+        if month_val.isdigit():
+            idx = int(month_val)
+            return idx if 1 <= idx <= 12 else 0
+        month = cls.MONTH_PREFIX.get(month_val[:3])
+        return cls.MONTH_ORDER_INDEX[month] + 1 if month else 0
+
+    @classmethod
+    def _author_key(cls, entry):
+        fields = entry.get("fields", {})
+        return cls._get_last_name(fields.get("author", ""))
+
+    @classmethod
+    def _sort_key(cls, group: Optional[str]):
+        """Sort key for `group`: primary author for "author", else (year, month)."""
+        return cls._author_key if group == "author" else cls._year_month_key
+
     @error_handler.handle
     def order_entries(
         self,
@@ -80,77 +198,8 @@ class GroupHTMLGenerator:
         if entries is None:
             raise OrderingError()
 
-        month_map = {
-            "jan": 1,
-            "january": 1,
-            "feb": 2,
-            "february": 2,
-            "mar": 3,
-            "march": 3,
-            "apr": 4,
-            "april": 4,
-            "may": 5,
-            "jun": 6,
-            "june": 6,
-            "jul": 7,
-            "july": 7,
-            "aug": 8,
-            "august": 8,
-            "sep": 9,
-            "september": 9,
-            "oct": 10,
-            "october": 10,
-            "nov": 11,
-            "november": 11,
-            "dec": 12,
-            "december": 12,
-        }
-
-        def get_last_name(author_field: Any) -> str:
-            if not author_field:
-                return ""
-
-            if isinstance(author_field, list):
-                authors = author_field
-            else:
-                s = str(author_field).strip()
-                s = (
-                    s.replace(" AND ", " and ")
-                    .replace(" And ", " and ")
-                    .replace(" AND", " and ")
-                    .replace("and", " and ")
-                )
-                authors = [a.strip() for a in s.split(" and ") if a.strip()]
-
-            if not authors:
-                return ""
-
-            primary = authors[0]
-
-            if "," in primary:
-                last = primary.split(",", 1)[0]
-            else:
-                parts = primary.split()
-                last = parts[-1] if parts else ""
-
-            return last.lower().strip()
-
-        def year_month_key(entry):
-            fields = entry.get("fields", {})
-            year_raw = fields.get("year", "")
-            year = int(str(year_raw)) if str(year_raw).isdigit() else 0
-            month_raw = str(fields.get("month", "")).strip().lower()
-            month = month_map.get(month_raw, 0)
-            return (year, month)
-
-        def author_key(entry):
-            fields = entry.get("fields", {})
-            return get_last_name(fields.get("author", ""))
-
-        if group == "author":
-            return sorted(entries, key=author_key, reverse=reverse)
-        # default: year/month
-        return sorted(entries, key=year_month_key, reverse=reverse)
+        # sorted() evaluates the key once per entry, not per comparison
+        return sorted(entries, key=self._sort_key(group), reverse=reverse)
 
     @error_handler.handle
     def group_entries(
@@ -158,7 +207,15 @@ class GroupHTMLGenerator:
         entries: Optional[List[Dict[str, Any]]] = None,
         by: str = "year",
         reverse: bool = True,
+        sort_buckets: bool = False,
     ) -> Dict[str, Any]:
+        """
+        Group entries by author, year, or year → month.
+
+        With sort_buckets, each bucket is ordered as order_entries would
+        (honoring `reverse`), so unordered entries can be grouped directly
+        instead of sorting the whole list first.
+        """
 
         if entries is None:
             raise GroupingError()
@@ -169,87 +226,132 @@ class GroupHTMLGenerator:
 
         # ---- AUTHOR GROUPING -----------------------------------------
         if by == "author":
-            grouped_authors: Dict[str, List[Dict[str, Any]]] = {}
+            grouped_authors: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
             for entry in entries:
                 fields = entry.get("fields", {})
                 authors = fields.get("author", [])
 
                 if isinstance(authors, str):
-                    if " and " in authors.lower():
-                        authors = [a.strip() for a in authors.split(" and ")]
-                    else:
-                        authors = [authors]
+                    authors = [a.strip() for a in _AND_SPLIT.split(authors)]
 
                 for author in authors:
-                    grouped_authors.setdefault(author, []).append(entry)
+                    grouped_authors[author].append(entry)
 
-            return grouped_authors
+            if sort_buckets:
+                self._sort_buckets(grouped_authors.values(), by, reverse)
+            return dict(grouped_authors)
 
         # ---- YEAR/MONTH OR YEAR GROUPING -----------------------------
         if is_year_month_group:
-            grouped_nested: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+            grouped_nested: Dict[str, Dict[str, List[Dict[str, Any]]]] = defaultdict(
+                lambda: defaultdict(list)
+            )
         else:
-            grouped_flat: Dict[str, List[Dict[str, Any]]] = {}
+            grouped_flat: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+        # Each distinct raw month value is resolved to a month name only once
+        month_keys: Dict[Any, str] = {}
 
         for entry in entries:
             fields = entry.get("fields", {})
             year = fields.get("year", "Unknown")
 
-            # Month parsing
-            month_val = str(fields.get("month", "")).strip().lower()
-            month = None
-            if month_val:
-                if month_val.isdigit():
-                    idx = int(month_val)
-                    if 1 <= idx <= 12:
-                        month = month_names[idx - 1]
-                else:
-                    for name in month_names:
-                        if name.lower().startswith(month_val[:3]):
-                            month = name
-                            break
-
             # YEAR/MONTH grouping
             if is_year_month_group:
-                year_bucket = grouped_nested.setdefault(year, {})
-                month_key = month or "Unknown"
-                year_bucket.setdefault(month_key, []).append(entry)
+                month_raw = fields.get("month", "")
+                month_key = month_keys.get(month_raw)
+                if month_key is None:
+                    month_key = month_keys[month_raw] = self._month_key(
+                        month_raw, month_names
+                    )
+                grouped_nested[year][month_key].append(entry)
 
             # YEAR-ONLY grouping
             else:
-                grouped_flat.setdefault(year, []).append(entry)
+                grouped_flat[year].append(entry)
+
+        if sort_buckets:
+            if is_year_month_group:
+                for months in grouped_nested.values():
+                    self._sort_buckets(months.values(), by, reverse)
+            else:
+                self._sort_buckets(grouped_flat.values(), by, reverse)
+
+        # Return correct shape, as plain dicts so lookups don't add groups
+        if is_year_month_group:
+            return {year: dict(months) for year, months in grouped_nested.items()}
+        return dict(grouped_flat)
+
+    def _month_key(self, month_raw: Any, month_names: List[str]) -> str:
+        """Month group name for a raw BibTeX month value, or "Unknown"."""
+        month_val = str(month_raw).strip().lower()
+        month = None
+        if month_val:
+            if month_val.isdigit():
+                idx = int(month_val)
+                if 1 <= idx <= 12:
+                    month = month_names[idx - 1]
+            else:
+                month = self.MONTH_PREFIX.get(month_val[:3])
+        return month or "Unknown"
 
-        # Return correct shape
-        return grouped_nested if is_year_month_group else grouped_flat
+    def _sort_buckets(self, buckets, group, reverse):
+        key = self._sort_key(group)
+        for bucket in buckets:
+            # Single-entry buckets (common for author groups) need no key
+            if len(bucket) > 1:
+                bucket.sort(key=key, reverse=reverse)
 
+    @error_handler.handle
     def render_groups(self, grouped_entries, reverse=False):
         """
-        Accepts the output of parser.group_entries() and returns clean HTML.
+        Accepts the output of parser.group_entries() and returns clean HTML,
+        or None (logged) if the style's template can't be loaded.
         """
-        blocks = []
         group_keys = self._sort_group_keys(list(grouped_entries.keys()), reverse)
 
+        # Author groups repeat entries once per co-author; render each once
+        rendered: Dict[int, str] = {}
+
+        def render(entry):
+            html = rendered.get(id(entry))
+            if html is None:
+                html = rendered[id(entry)] = self._render_entry(entry)
+            return html
+
+        # One flat list of pieces and separators, joined once at the end;
+        # headers go in as pieces too, so nothing is concatenated per group
+        out: List[str] = []
         for group_name in group_keys:
             group_items = grouped_entries[group_name]
-            html_parts = []
+            if out:
+                out.append("\n\n")
+            out += ("<h2>", str(group_name), "</h2>\n")
 
             if isinstance(group_items, dict):
                 months = self._sort_months(list(group_items.keys()))
-                for month in months:
-                    html_parts.append(f"<h3>{month}</h3>")
+                for i, month in enumerate(months):
+                    if i:
+                        out.append("\n\n")
+                    out += ("<h3>", str(month), "</h3>")
                     for entry in group_items[month]:
-                        html_parts.append(self._render_entry(entry))
+                        out.append("\n\n")
+                        out.append(render(entry))
 
             else:
-                for entry in group_items:
-                    html_parts.append(self._render_entry(entry))
+                for i, entry in enumerate(group_items):
+                    if i:
+                        out.append("\n\n")
+                    out.append(render(entry))
 
-            block = f"<h2>{group_name}</h2>\n" + "\n\n".join(html_parts)
-            blocks.append(block)
-
-        return "\n\n".join(blocks)
+        return "".join(out)
 
+    @error_handler.handle
     def render_flat(self, entries):
-        """Render entries WITHOUT any group <h2> or month <h3> headers."""
-        return "\n".join(self._render_entry(e) for e in entries)
+        """
+        Render entries WITHOUT any group <h2> or month <h3> headers, or
+        None (logged) if the style's template can't be loaded.
+        """
+        # join() builds a list from a generator first; hand it one directly
+        return "\n".join([self._render_entry(e) for e in entries])
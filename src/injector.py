@@ -1,6 +1,9 @@
 # Third-Party Library Imports
+import hashlib
 import re
-from typing import Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
 # Local Imports
@@ -19,6 +22,29 @@ from .error_handler import (
 # Initialize Error Handling
 error_handler = ErrorHandler()
 
+# Line boundaries str.splitlines() honours besides "\n"
+_RE_OTHER_LINE_BREAKS = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+# Leading whitespace of the first line, split as str.splitlines() does, that
+# has text after it; break characters never count as indentation
+_RE_INDENTED_LINE = re.compile(
+    "(?:\\A|(?<=[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]))"
+    "([^\\S\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]+)\\S"
+)
+
+# Ordered or grouped entries by (bib_text digest, group, reverse), most recent
+# last. Grouping doesn't depend on style, target or DOI icon, so re-submitting
+# a bibliography with other settings skips parsing, ordering and grouping; the
+# digest keeps the uploaded text itself out of the keys.
+_ARRANGED_CACHE: "OrderedDict[Tuple[bytes, Optional[str], bool], Any]" = OrderedDict()
+_ARRANGED_CACHE_SIZE = 32
+_arranged_lock = Lock()
+
+# Final pipeline output by a digest of every input, most recent last; the
+# digest keeps large templates and bibliographies out of the keys
+_PIPELINE_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_PIPELINE_CACHE_SIZE = 64
+_pipeline_lock = Lock()
+
 
 class Injector:
     """
@@ -33,6 +59,9 @@ class Injector:
         """
         self.template_path: Optional[Path] = None
         self.is_path = is_path
+        self._div_bounds: Dict[str, Tuple[int, int, int, str]] = {}
+        # (target_id, html_to_inject, result) of the latest injection
+        self._last_injection: Optional[Tuple[str, str, str]] = None
 
         if is_path:
             self.template_path = Path(template)
@@ -41,7 +70,7 @@ class Injector:
                 raise TemplateNotFoundError(f"Template not found: {template}")
 
             self.html = self._read_template()
-            error_handler.info(f"Loaded template from '{template}'")
+            error_handler.info("Loaded template from '%s'", template)
 
         else:
             if not template.strip():
@@ -50,13 +79,20 @@ class Injector:
             self.html = template
             error_handler.info("Loaded template from string input.")
 
+        # The template never changes, so its indent unit is detected once
+        self._indent_unit: str = self._detect_indent_unit()
+
     def _read_template(self) -> str:
         assert self.template_path is not None
-        content = self.template_path.read_text(encoding="utf-8")
-        if not content:
+        raw = self.template_path.read_bytes()
+        if not raw:
             raise TemplateReadError(
                 f"Template is empty or unreadable: {self.template_path}"
             )
+        content = raw.decode("utf-8")
+        # Keep read_text's universal-newline behaviour
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         return content
 
     @error_handler.handle
@@ -76,69 +112,122 @@ class Injector:
             ValueError: If the target <div id="{target_id}"> is not found.
             OSError: If there is an issue reading the file.
         """
-        # Accepts id="x" or id='x'
-        id_attr = rf'id=["\']{target_id}["\']'
+        last = self._last_injection
+        if last is not None and last[0] == target_id and last[1] == html_to_inject:
+            return last[2]
 
-        # Match the opening div, regardless of quotes
-        open_div_pattern = re.compile(
-            rf"^(?P<indent>[ \t]*)<div\s+[^>]*{id_attr}[^>]*>",
-            re.MULTILINE,
+        open_start, open_end, close_start, base_indent = self._find_div_bounds(
+            target_id
         )
-        open_div_match = open_div_pattern.search(self.html)
+        indent_unit = self._indent_unit
+
+        # Prefix every line with one replace() instead of a line loop, unless
+        # the block has line breaks only splitlines() understands
+        body = html_to_inject.strip("\n")
+        prefix = base_indent + indent_unit
+        if not body:
+            indented_html = ""
+        elif _RE_OTHER_LINE_BREAKS.search(body):
+            indented_html = prefix + ("\n" + prefix).join(body.splitlines())
+        else:
+            indented_html = prefix + body.replace("\n", "\n" + prefix)
 
-        if not open_div_match:
-            raise HTMLElementNotFoundError(f"Could not find <div id='{target_id}'>")
+        # Whatever the div held before (nothing, whitespace or markup) is
+        # replaced by the indented block on its own lines, in one join
+        html = self.html
+        result = "".join(
+            (html[:open_end], "\n", indented_html, "\n", base_indent, html[close_start:])
+        )
 
-        base_indent = open_div_match.group("indent")
-        indent_unit = self._detect_indent_unit()
+        self._last_injection = (target_id, html_to_inject, result)
+        error_handler.info("HTML successfully injected into <div id='%s'>", target_id)
+        return result
 
-        inject_lines = html_to_inject.strip("\n").splitlines()
-        indented_html = "\n".join(
-            f"{base_indent}{indent_unit}{line}" for line in inject_lines
-        )
+    def _find_div_bounds(self, target_id: str) -> Tuple[int, int, int, str]:
+        """
+        Locates the <div> with the given id using plain string searches.
 
-        # Full block matcher: handles:
-        #   <div ...> ... </div>
-        #   <div ...></div>
-        #   <div ...>   </div>
-        full_div_pattern = re.compile(
-            rf"(?P<open><div\s+[^>]*{id_attr}[^>]*>)"
-            rf"(?P<inner>.*?)"
-            rf"(?P<close></div>)",
-            re.DOTALL,
-        )
+        The opening tag must start its line (after indentation) and its
+        closing tag is found by counting nested <div> elements. Results are
+        kept per target_id, since the template never changes.
 
-        match = full_div_pattern.search(self.html)
-        if not match:
-            raise InjectionError(
-                f"Full <div id='{target_id}'> block not found for injection."
-            )
+        Args:
+            target_id (str): The ID of the <div>, quoted with " or '.
 
-        open_tag = match.group("open")
-        close_tag = match.group("close")
+        Returns:
+            tuple: (opening tag start, opening tag end, closing tag start, indent)
 
-        # If one-liner (<div id="x"></div>), add newline/indentation
-        if match.group("inner").strip() == "":
-            new_inner = f"\n{indented_html}\n{base_indent}"
-        else:
-            # Multi-line div
-            new_inner = f"\n{indented_html}\n{base_indent}"
+        Raises:
+            HTMLElementNotFoundError: If the opening <div> is not found.
+            InjectionError: If the matching </div> is not found.
+        """
+        bounds = self._div_bounds.get(target_id)
+        if bounds is None:
+            bounds = self._div_bounds[target_id] = self._scan_div_bounds(target_id)
+        return bounds
+
+    def _scan_div_bounds(self, target_id: str) -> Tuple[int, int, int, str]:
+        html = self.html
+        open_start = -1
+        id_end = -1
+        # Once a match is found, the other quote style only needs checking
+        # in the text before it
+        limit = len(html)
+        for needle in (f'id="{target_id}"', f"id='{target_id}'"):
+            pos = html.find(needle, 0, limit)
+            while pos != -1:
+                tag_start = html.rfind("<", 0, pos)
+                if self._is_line_div_tag(tag_start, pos):
+                    open_start, id_end, limit = tag_start, pos + len(needle), pos
+                    break
+                pos = html.find(needle, pos + 1, limit)
+
+        open_end = html.find(">", id_end) + 1
+        if open_start == -1 or open_end == 0:
+            raise HTMLElementNotFoundError(f"Could not find <div id='{target_id}'>")
 
-        result = (
-            self.html[: match.start()]
-            + f"{open_tag}{new_inner}{close_tag}"
-            + self.html[match.end() :]
+        line_start = html.rfind("\n", 0, open_start) + 1
+        base_indent = html[line_start:open_start]
+
+        # Walk <div ...> / </div> tags until the opening one is balanced
+        depth = 1
+        pos = open_end
+        while True:
+            close_start = html.find("</div>", pos)
+            if close_start == -1:
+                raise InjectionError(
+                    f"Full <div id='{target_id}'> block not found for injection."
+                )
+            nested = html.find("<div", pos, close_start)
+            while nested != -1:
+                if html[nested + 4 : nested + 5] in (">", " ", "\t", "\n", "\r"):
+                    depth += 1
+                nested = html.find("<div", nested + 4, close_start)
+            depth -= 1
+            if depth == 0:
+                return open_start, open_end, close_start, base_indent
+            pos = close_start + len("</div>")
+
+    def _is_line_div_tag(self, tag_start: int, id_pos: int) -> bool:
+        """
+        Checks that the attribute at `id_pos` belongs to a <div> opening tag
+        starting at `tag_start`, with only indentation before it on its line.
+        """
+        html = self.html
+        line_start = html.rfind("\n", 0, tag_start) + 1
+        return (
+            tag_start != -1
+            and html.startswith("<div", tag_start)
+            and html[tag_start + 4].isspace()
+            and html[id_pos - 1].isspace()
+            and ">" not in html[tag_start:id_pos]
+            and not html[line_start:tag_start].strip(" \t")
         )
 
-        error_handler.info(f"HTML successfully injected into <div id='{target_id}'>")
-        return result
-
     def _detect_indent_unit(self) -> str:
-        for line in self.html.splitlines():
-            stripped = line.lstrip()
-            if stripped and len(line) > len(stripped):
-                return line[: len(line) - len(stripped)]
-        return "  "  # fallback to 2 spaces
+        # Same rule as lstrip() over splitlines(), in one search
+        match = _RE_INDENTED_LINE.search(self.html)
+        return match.group(1) if match else "  "  # fallback to 2 spaces
 
     @error_handler.handle
     def save_injected_html_as(
@@ -163,11 +252,11 @@ class Injector:
                 f"Output path '{output_path}' exists but is not a file."
             )
 
-        written = path.write_text(result, encoding="utf-8")
+        written = path.write_bytes(result.encode("utf-8"))
         if written is None:
             raise FileWriteError(f"Failed to write to '{output_path}'")
 
-        error_handler.info(f"Injected HTML saved to '{output_path}'")
+        error_handler.info("Injected HTML saved to '%s'", output_path)
 
     @error_handler.handle
     def replace_template_with_injected_html(
@@ -186,39 +275,80 @@ class Injector:
         result = self.inject_html(html_to_inject, target_id)
 
         assert self.template_path is not None
-        written = self.template_path.write_text(result, encoding="utf-8")
+        written = self.template_path.write_bytes(result.encode("utf-8"))
         if written is None:
             raise FileWriteError(f"Failed to write to template '{self.template_path}'")
 
-        error_handler.info(f"Replaced original file '{self.template_path}'")
+        error_handler.info("Replaced original file '%s'", self.template_path)
 
+    @staticmethod
     def run_injection_pipeline(html_text, bib_text, style, order, group, target_id, doi_icon):
         """Runs the BibInject pipeline using form or CLI values and returns final HTML."""
-
-        # Step 1: Parse BibTeX
-        parser = Parser(expand_strings=True)
-        data = parser.parse_string(bib_text)
-        entries = data.get("entries", [])
-        if not entries:
-            return "Error: No valid BibTeX entries found."
+        inputs = (html_text, bib_text, style, order, group, target_id, doi_icon)
+        digest = hashlib.blake2b(repr(inputs).encode("utf-8")).digest()
+        with _pipeline_lock:
+            cached = _PIPELINE_CACHE.get(digest)
+            if cached is not None:
+                _PIPELINE_CACHE.move_to_end(digest)
+                return cached
 
         doi_icon = None if not doi_icon or doi_icon.lower() == "none" else doi_icon
+        reverse_order = order == "desc"
 
-        # Step 2: Order entries (reverse=True for desc)
+        bib_digest = hashlib.blake2b(bib_text.encode("utf-8")).digest()
+        cache_key = (bib_digest, group or None, reverse_order)
+        with _arranged_lock:
+            arranged = _ARRANGED_CACHE.get(cache_key)
+            if arranged is not None:
+                _ARRANGED_CACHE.move_to_end(cache_key)
+
+        if arranged is None:
+            # Step 1: Parse BibTeX
+            parser = Parser(expand_strings=True)
+            data = parser.parse_string(bib_text)
+            entries = data.get("entries", [])
+            if not entries:
+                return "Error: No valid BibTeX entries found."
+
+        # Built only once there are entries, as input without any is reported
+        # above whatever the style
         html_gen = GroupHTMLGenerator(style, doi_icon=doi_icon)
-        reverse_order = order == "desc"
-        entries = html_gen.order_entries(entries, reverse=reverse_order, group=group)
 
-        # Step 3: Group entries
+        if arranged is None:
+            # Step 2: Group entries, ordering within each group (reverse=True for desc)
+            if group:
+                arranged = html_gen.group_entries(
+                    entries, by=group, reverse=reverse_order, sort_buckets=True
+                )
+            else:
+                # Step 3: Without groups, order the flat list
+                arranged = html_gen.order_entries(
+                    entries, reverse=reverse_order, group=group
+                )
+
+            # Rendering only reads entries, so cached results are shared as-is
+            if arranged is not None:
+                with _arranged_lock:
+                    _ARRANGED_CACHE[cache_key] = arranged
+                    while len(_ARRANGED_CACHE) > _ARRANGED_CACHE_SIZE:
+                        _ARRANGED_CACHE.popitem(last=False)
+
         if group:
-            grouped = html_gen.group_entries(entries, by=group)
-            combined_html = html_gen.render_groups(grouped, reverse=reverse_order)
+            combined_html = html_gen.render_groups(arranged, reverse=reverse_order)
         else:
-            grouped = {"flat": entries} if group else entries
-            combined_html = html_gen.render_flat(entries)
+            combined_html = html_gen.render_flat(arranged)
+
+        # A missing or empty style template was already logged by the renderer
+        if combined_html is None:
+            return None
 
         # Step 5: Inject final HTML
         injector = Injector(html_text, is_path=False)
         final_html = injector.inject_html(combined_html, target_id)
 
+        if final_html is not None:
+            with _pipeline_lock:
+                _PIPELINE_CACHE[digest] = final_html
+                while len(_PIPELINE_CACHE) > _PIPELINE_CACHE_SIZE:
+                    _PIPELINE_CACHE.popitem(last=False)
         return final_html
@@ -1,6 +1,8 @@
 # Third-Party Library Imports
 import re
 import os
+import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -10,6 +12,40 @@ from .error_handler import ErrorHandler, ParsingError, FileNotFoundError, FileRe
 # Initialize Error Handling
 error_handler = ErrorHandler()
 
+# Patterns used on every parse, compiled once
+_RE_LINE_JOIN = re.compile(r"\s*\n\s*")
+_RE_ENTRY_HEAD = re.compile(r"\s*([^,]+)\s*,")
+# A negated class for quoted values scans to the closing quote without the
+# per-character retries of a lazy ".*?"
+_RE_FIELD = re.compile(
+    r'\s*([\w\-]+)\s*=\s*({(?:[^{}]|{[^{}]*})*}|"[^"]*"|[^,{}]+)\s*,?'
+)
+_RE_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Parsed .bib files by resolved path, least recent first, with the
+# (mtime, size, expand_strings) they were parsed under and the @string map
+_ParseCacheItem = Tuple[Tuple[int, int, bool], Dict[str, List[Any]], Dict[str, str]]
+_PARSE_CACHE: "OrderedDict[str, _ParseCacheItem]" = OrderedDict()
+_PARSE_CACHE_SIZE = 32
+
+
+def _copy_parsed(data: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """
+    Copy parse results down to each entry's fields and each macro dict, so
+    neither the cache nor its callers see the other's changes.
+    """
+    return {
+        name: [
+            (
+                {k: dict(v) if isinstance(v, dict) else v for k, v in item.items()}
+                if isinstance(item, dict)
+                else item
+            )
+            for item in items
+        ]
+        for name, items in data.items()
+    }
+
 
 class Parser:
     """
@@ -24,6 +60,11 @@ class Parser:
             "preambles": [],
             "strings": [],
         }
+        # Flat view of the @string macros for expansion lookups
+        self._string_map: Dict[str, str] = {}
+        # Per-field value columns and the key index, built on first request
+        self._field_columns: Dict[str, List[Optional[str]]] = {}
+        self._entries_by_key: Optional[Dict[str, Dict[str, Any]]] = None
 
     @error_handler.handle
     def parse_file(self, filename: str) -> Dict[str, List[Any]]:
@@ -48,8 +89,36 @@ class Parser:
         if not os.access(file_path, os.R_OK):
             raise FileReadError(f"File exists but is not readable: {filename}")
 
-        content = file_path.read_text(encoding="utf-8")
-        return self.parse_string(content)
+        stat = file_path.stat()
+        cache_key = str(file_path.resolve())
+        signature = (stat.st_mtime_ns, stat.st_size, self.expand_strings)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            _PARSE_CACHE.move_to_end(cache_key)
+            self.data = _copy_parsed(cached[1])
+            self._string_map = dict(cached[2])
+            self._field_columns = {}
+            self._entries_by_key = None
+            error_handler.info("Reused parsed content of unchanged file '%s'", filename)
+            return self.data
+
+        # One decode of the raw bytes, skipping the TextIOWrapper
+        content = file_path.read_bytes().decode("utf-8")
+        if "\r" in content:
+            # Keep read_text's universal-newline behaviour
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        result = self.parse_string(content)
+        if result is not None:
+            _PARSE_CACHE[cache_key] = (
+                signature,
+                _copy_parsed(result),
+                dict(self._string_map),
+            )
+            _PARSE_CACHE.move_to_end(cache_key)
+            while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return result
 
     @error_handler.handle
     def parse_string(self, content: str) -> Dict[str, List[Any]]:
@@ -63,24 +132,36 @@ class Parser:
             dict: Parsed BibTeX data structure with entries, comments, etc.
         """
         self.data = {"entries": [], "comments": [], "preambles": [], "strings": []}
-        seen_keys = {}
-
-        # Remove line continuations and combine lines
-        content = re.sub(r"\s*\n\s*", " ", content)
-
+        self._string_map = {}
+        self._field_columns = {}
+        self._entries_by_key = None
+        entries = self.data["entries"]
+        comments = self.data["comments"]
+        preambles = self.data["preambles"]
+        strings = self.data["strings"]
+        seen_keys = set()
+
+        # Remove line continuations and combine lines; a C-level "\n" check
+        # spares single-line input the regex scan, which can't match there
+        if "\n" in content:
+            content = _RE_LINE_JOIN.sub(" ", content)
+
+        # Each '@' is found once; the '{' search only spans the entry type
+        find = content.find
         pos = 0
         while True:
-            at_pos = content.find("@", pos)
+            at_pos = find("@", pos)
             if at_pos == -1:
                 break
 
-            brace_pos = content.find("{", at_pos)
+            brace_pos = find("{", at_pos)
             if brace_pos == -1:
                 raise ParsingError(
                     f"Opening brace '{{' not found after '@' at position {at_pos}"
                 )
 
-            entry_type = content[at_pos + 1 : brace_pos].strip().lower()
+            # Types and field names repeat across entries; share one copy each
+            entry_type = sys.intern(content[at_pos + 1 : brace_pos].strip().lower())
             if not entry_type:
                 raise ParsingError(f"Entry type missing after '@' at position {at_pos}")
 
@@ -93,32 +174,39 @@ class Parser:
             pos = end_pos
 
             if entry_type == "comment":
-                self.data["comments"].append(entry_content.strip())
+                comments.append(entry_content.strip())
             elif entry_type == "preamble":
                 preamble_content = entry_content.strip()
                 if preamble_content.startswith('"') and preamble_content.endswith('"'):
                     preamble_content = preamble_content[1:-1]
-                self.data["preambles"].append(preamble_content)
+                preambles.append(preamble_content)
             elif entry_type == "string":
                 kv = self._parse_key_value(entry_content)
                 if not kv:
                     raise ParsingError(
                         f"Invalid string entry content at position {brace_pos}"
                     )
-                self.data["strings"].append(kv)
+                strings.append(kv)
+                # The first definition of a macro wins, as in the list scan
+                for name, text in kv.items():
+                    self._string_map.setdefault(name, text)
             else:
-                entry = self._parse_entry(entry_type, entry_content)
-                key = entry.get("key")
+                # Read only the citation key first, so the fields of
+                # duplicate entries are never parsed
+                head = _RE_ENTRY_HEAD.match(entry_content)
+                key = head.group(1).strip() if head else None
                 if not key:
                     raise ParsingError(
                         f"Missing key in entry of type '{entry_type}' at position {brace_pos}"
                     )
                 if key not in seen_keys:
-                    seen_keys[key] = True
-                    self.data["entries"].append(entry)
+                    seen_keys.add(key)
+                    entries.append(
+                        self._parse_entry(entry_type, entry_content, head)
+                    )
 
         error_handler.info(
-            f"Parsed string content successfully, found {len(self.data['entries'])} entries"
+            "Parsed string content successfully, found %d entries", len(entries)
         )
         return self.data
 
@@ -138,15 +226,40 @@ class Parser:
         """Return list of BibTeX string macros."""
         return self.data.get("strings", [])
 
+    def get_entry_by_key(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry with the given citation key, or None."""
+        if self._entries_by_key is None:
+            self._entries_by_key = {
+                entry["key"]: entry for entry in self.data.get("entries", [])
+            }
+        return self._entries_by_key.get(key)
+
+    def get_field_column(self, field_name: str) -> List[Optional[str]]:
+        """
+        Return the value of field_name for every entry, in entry order.
+
+        Entries without the field give None. Columns are built once per
+        parse, so scans like "all years" don't walk every entry dict again.
+        """
+        column = self._field_columns.get(field_name)
+        if column is None:
+            column = self._field_columns[field_name] = [
+                entry.get("fields", {}).get(field_name)
+                for entry in self.data.get("entries", [])
+            ]
+        return column
+
     def get_entry_fields(self, entry: Any) -> Optional[Dict[str, str]]:
         """Given an entry dict, return its fields dict or None if invalid."""
         return entry.get("fields") if isinstance(entry, dict) else None
 
     def get_entry_field(self, entry: Any, field_name: str) -> Optional[str]:
         """Return value of field_name for given entry, or None if not found."""
-        fields = self.get_entry_fields(entry)
-        if fields:
-            return fields.get(field_name)
+        # Inlined get_entry_fields: one type check and two dict lookups
+        if isinstance(entry, dict):
+            fields = entry.get("fields")
+            if fields:
+                return fields.get(field_name)
         return None
 
     def get_entry_key(self, entry: Any) -> Optional[str]:
@@ -177,18 +290,22 @@ class Parser:
         """
         assert s[start] == "{"
         depth = 1
-        i = start + 1
-        while i < len(s) and depth > 0:
-            if s[i] == "{":
+        # Jump between braces with str.find rather than stepping per character
+        next_open = s.find("{", start + 1)
+        pos = start + 1
+        while True:
+            close = s.find("}", pos)
+            if close == -1:
+                raise ParsingError(
+                    f"Unbalanced braces in entry starting at position {start}"
+                )
+            while next_open != -1 and next_open < close:
                 depth += 1
-            elif s[i] == "}":
-                depth -= 1
-            i += 1
-        if depth != 0:
-            raise ParsingError(
-                f"Unbalanced braces in entry starting at position {start}"
-            )
-        return s[start + 1 : i - 1], i
+                next_open = s.find("{", next_open + 1)
+            depth -= 1
+            pos = close + 1
+            if depth == 0:
+                return s[start + 1 : close], pos
 
     def _parse_key_value(self, text: str) -> Dict[str, str]:
         """
@@ -200,52 +317,51 @@ class Parser:
         Returns:
             dict: Parsed key-value pair.
         """
-        parts = text.split("=", 1)
-        if len(parts) == 2:
-            key = parts[0].strip()
-            value = parts[1].strip().strip(",").strip('"{}')
-            return {key: value}
+        # The strips run in sequence on purpose: each one stops at characters
+        # the next one removes, and str.strip returns unchanged input as-is
+        name, sep, rest = text.partition("=")
+        if sep:
+            return {name.strip(): rest.strip().strip(",").strip('"{}')}
         return {}
 
-    def _parse_entry(self, entry_type: str, text: str) -> Dict[str, Any]:
+    def _parse_entry(
+        self, entry_type: str, text: str, head: Optional["re.Match[str]"] = None
+    ) -> Dict[str, Any]:
         """
         Parse a BibTeX entry into its components.
 
         Args:
             entry_type (str): Type of the BibTeX entry (e.g., article, book).
             text (str): Raw entry content.
+            head (re.Match, optional): _RE_ENTRY_HEAD match on `text` already
+                made by the caller; matched here when omitted.
 
         Returns:
             dict: Dictionary containing entry type, citation key, and fields.
         """
-        match = re.match(r"\s*([^,]+)\s*,(.*)", text, re.DOTALL)
+        match = head or _RE_ENTRY_HEAD.match(text)
         if not match:
             return {"type": entry_type, "raw": text}
 
         citation_key = match.group(1).strip()
-        fields_text = match.group(2)
 
         fields = {}
-        while fields_text:
-            field_match = re.match(
-                r'\s*([\w\-]+)\s*=\s*({(?:[^{}]|{[^{}]*})*}|".*?"|[^,{}]+)\s*,?',
-                fields_text,
-                re.DOTALL,
-            )
+        # Match in place from `pos` instead of re-slicing the remaining text
+        match_field = _RE_FIELD.match
+        pos, end = match.end(), len(text)
+        while pos < end:
+            field_match = match_field(text, pos)
             if not field_match:
                 break
-            key = field_match.group(1).strip()
-            value_raw = field_match.group(2).strip()
-            value = value_raw.strip('"{} ')
+            name, value_raw = field_match.group(1, 2)
+            key = sys.intern(name.strip())
+            value = value_raw.strip().strip('"{} ')
 
             # If it's a bare word (not quoted or braced), check for macro
-            if self.expand_strings and re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", value):
-                for d in self.data["strings"]:
-                    if value in d:
-                        value = d[value]
-                        break
+            if self.expand_strings and _RE_IDENT.match(value):
+                value = self._string_map.get(value, value)
 
             fields[key] = value
-            fields_text = fields_text[field_match.end() :]
+            pos = field_match.end()
 
         return {"type": entry_type, "key": citation_key, "fields": fields}
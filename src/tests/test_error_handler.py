@@ -1,5 +1,7 @@
 import logging
+import pytest
 from src.error_handler import (
+    BibInjectError,
     TemplateNotFoundError,
     TemplateReadError,
     HTMLElementNotFoundError,
@@ -17,39 +19,86 @@ from src.error_handler import (
 logger = logging.getLogger(__name__)
 
 
-def test_custom_error_messages():
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (TemplateNotFoundError, "Missing file"),
+        (TemplateReadError, "Read failed"),
+        (InjectionError, "Bad injection"),
+        (ParsingError, "Parsing failed"),
+        (OrderingError, "Ordering failed"),
+        (GroupingError, "Grouping failed"),
+        (FileNotFoundError, "File missing"),
+        (FileWriteError, "Write failed"),
+        (FileReadError, "Read failed"),
+        (EmptyFileError, "Empty file"),
+        (HTMLElementNotFoundError, "HTML element missing"),
+    ],
+)
+def test_custom_error_messages(error, message):
     # Test exception message when custom message provided
-    assert str(TemplateNotFoundError("Missing file")) == "Missing file"
-    assert str(TemplateReadError("Read failed")) == "Read failed"
-    assert str(InjectionError("Bad injection")) == "Bad injection"
-    assert str(ParsingError("Parsing failed")) == "Parsing failed"
-    assert str(OrderingError("Ordering failed")) == "Ordering failed"
-    assert str(GroupingError("Grouping failed")) == "Grouping failed"
-    assert str(FileNotFoundError("File missing")) == "File missing"
-    assert str(FileWriteError("Write failed")) == "Write failed"
-    assert str(FileReadError("Read failed")) == "Read failed"
-    assert str(EmptyFileError("Empty file")) == "Empty file"
-    assert (
-        str(HTMLElementNotFoundError("HTML element missing")) == "HTML element missing"
-    )
-
-
-def test_default_error_messages():
+    assert str(error(message)) == message
+
+
+@pytest.mark.parametrize(
+    "error, default",
+    [
+        (TemplateNotFoundError, "HTML template file was not found."),
+        (TemplateReadError, "Failed to read HTML template content."),
+        (InjectionError, "Failed to inject BibTeX content into the HTML."),
+        (ParsingError, "An error occurred while parsing the file."),
+        (OrderingError, "An error occurred while ordering entry group."),
+        (GroupingError, "An error occurred while grouping entry group."),
+        (FileNotFoundError, "File not found."),
+        (FileWriteError, "An error occurred while writing to the file."),
+        (FileReadError, "An error occurred while reading the file."),
+        (EmptyFileError, "The file is empty and cannot be processed."),
+        (HTMLElementNotFoundError, "Target HTML element was not found in the HTML."),
+    ],
+)
+def test_default_error_messages(error, default):
     # Test exception message when no custom message provided (default)
-    assert str(TemplateNotFoundError()) == "HTML template file was not found."
-    assert str(TemplateReadError()) == "Failed to read HTML template content."
-    assert str(InjectionError()) == "Failed to inject BibTeX content into the HTML."
-    assert str(ParsingError()) == "An error occurred while parsing the file."
-    assert str(OrderingError()) == "An error occurred while ordering entry group."
-    assert str(GroupingError()) == "An error occurred while grouping entry group."
-    assert str(FileNotFoundError()) == "File not found."
-    assert str(FileWriteError()) == "An error occurred while writing to the file."
-    assert str(FileReadError()) == "An error occurred while reading the file."
-    assert str(EmptyFileError()) == "The file is empty and cannot be processed."
-    assert (
-        str(HTMLElementNotFoundError())
-        == "Target HTML element was not found in the HTML."
-    )
+    assert str(error()) == default
+
+
+_ALL_ERRORS = (
+    TemplateNotFoundError,
+    TemplateReadError,
+    HTMLElementNotFoundError,
+    InjectionError,
+    ParsingError,
+    OrderingError,
+    GroupingError,
+    FileNotFoundError,
+    FileWriteError,
+    FileReadError,
+    EmptyFileError,
+)
+
+
+@pytest.mark.parametrize("error", _ALL_ERRORS)
+@pytest.mark.parametrize("message", ["Something specific went wrong", None])
+def test_handle_catches_errors_as_base_class(error, message, caplog):
+    handler = ErrorHandler()
+    caught = []
+
+    def failing():
+        try:
+            raise error(message) if message else error()
+        except BibInjectError as e:
+            caught.append(e)
+            raise
+
+    caplog.set_level(logging.ERROR)
+    result = handler.handle(failing)()
+
+    expected = message or error.default_message
+    assert result is None
+    assert len(caught) == 1 and type(caught[0]) is error
+    record = caplog.records[-1]
+    assert record.levelno == logging.ERROR
+    assert record.getMessage() == f"{error.__name__}: {expected}"
+    assert not record.exc_info  # known errors skip the traceback
 
 
 def test_error_handler_logging_info(caplog):
@@ -57,8 +106,9 @@ def test_error_handler_logging_info(caplog):
     caplog.set_level(logging.INFO)
 
     handler.info("This is an info log.")
-    assert "This is an info log." in caplog.text
-    assert any(record.levelname == "INFO" for record in caplog.records)
+    record = caplog.records[-1]
+    assert record.levelno == logging.INFO
+    assert record.getMessage() == "This is an info log."
 
 
 def test_error_handler_logging_warning(caplog):
@@ -66,8 +116,9 @@ def test_error_handler_logging_warning(caplog):
     caplog.set_level(logging.WARNING)
 
     handler.warning("This is a warning.")
-    assert "This is a warning." in caplog.text
-    assert any(record.levelname == "WARNING" for record in caplog.records)
+    record = caplog.records[-1]
+    assert record.levelno == logging.WARNING
+    assert record.getMessage() == "This is a warning."
 
 
 def test_error_handler_logging_error(caplog):
@@ -75,5 +126,6 @@ def test_error_handler_logging_error(caplog):
     caplog.set_level(logging.ERROR)
 
     handler.error("This is an error!")
-    assert "This is an error!" in caplog.text
-    assert any(record.levelname == "ERROR" for record in caplog.records)
+    record = caplog.records[-1]
+    assert record.levelno == logging.ERROR
+    assert record.getMessage() == "This is an error!"
@@ -7,23 +7,25 @@ from src.gen import Generator
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
-def mock_apa_template(tmp_path):
-    html_content = textwrap.dedent(
-        """
+_APA_TEMPLATE = textwrap.dedent(
+    """
     <!-- Article -->
     <p id="bi-article">
       {{author}}. ({{year}}). {{title}}. <em>{{journal}}</em>, <em>{{volume}}</em>({{number}}), {{pages}}.
     </p>
     """
-    )
-    path = tmp_path / "mock-apa.html"
-    path.write_text(html_content, encoding="utf-8")
-    logger.info(f"Template written to {path}")
-    return str(path)
+)
+
 
+@pytest.fixture(scope="module")
+def mock_apa_template(tmp_path_factory):
+    path = tmp_path_factory.mktemp("templates") / "mock-apa.html"
+    path.write_text(_APA_TEMPLATE, encoding="utf-8")
+    logger.info("Template written to %s", path)
+    return path
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_entry():
     return {
         "type": "article",
@@ -72,8 +74,8 @@ def test_render(mock_entry, mock_apa_template):
     ]
     g = Generator(mock_entry, mock_apa_template)
     out = g._render(mock_out)
-    logger.info(repr(out))
-    assert repr(out) == repr(
+    logger.info("%r", out)
+    assert out == (
         '<p id="bi-article">\nJean César, Ary Costa. (2013). An amazing title. <em>Nice Journal</em>, <em>12</em>, 12--23.\n</p>'
     )
 
@@ -86,6 +88,43 @@ def test_generate_html(mock_entry, mock_apa_template):
     logger.info(g.type)
     out = g.generate_html()
     logger.info(out)
-    assert repr(out) == repr(
+    assert out == (
         '<p id="bi-article">\nJean César, Ary Costa. (2013). An amazing title. <em>Nice Journal</em>, <em>12</em>, 12--23.\n</p>'
     )
+
+
+def test_trim_missing_fields(mock_entry):
+    g = Generator(mock_entry, "apa")
+    text = "Jean César. (). An amazing title. <em>Nice Journal</em>, <em>12</em>(),  , 12--23 .  \n"
+    out = g._trim(text)
+    logger.info("%r", out)
+    assert out == (
+        "Jean César. An amazing title. <em>Nice Journal</em>, <em>12</em>, 12--23.\n"
+    )
+
+
+def test_generate_html_doi_icon_with_backslashes(mock_entry, mock_apa_template):
+    entry = {**mock_entry, "fields": {**mock_entry["fields"], "doi": "10.1000/xyz"}}
+    g = Generator(entry, mock_apa_template, doi_icon=r"C:\icons\doi.svg")
+    out = g.generate_html()
+    logger.info(out)
+    assert out.startswith('<p id="bi-article">\n<a href="https://doi.org/10.1000/xyz"')
+    assert r"C:\icons\doi.svg" in out
+
+
+def test_render_batch_with_prepared_template(mock_entry, mock_apa_template):
+    entries = [
+        mock_entry,
+        {**mock_entry, "fields": {**mock_entry["fields"], "year": "2014"}},
+        {**mock_entry, "fields": {**mock_entry["fields"], "title": "Another title"}},
+    ]
+
+    # Read and split the template once, then render every entry against it
+    prepared = Generator.prepare(mock_apa_template, "article")
+    g = Generator(None, mock_apa_template)
+    batch = [g.render(entry, prepared) for entry in entries]
+    logger.info(batch)
+
+    assert batch == [Generator(e, mock_apa_template).generate_html() for e in entries]
+    assert "(2014)" in batch[1]
+    assert "Another title" in batch[2]
@@ -1,15 +1,15 @@
+import hashlib
 import textwrap
 import logging
 import pytest
+from src import injector as injector_module
 from src.injector import Injector
 
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
-def template_file(tmp_path):
-    html_content = textwrap.dedent(
-        """
+_TEMPLATE_HTML = textwrap.dedent(
+    """
         <!DOCTYPE html>
         <html lang="en">
           <head>
@@ -32,14 +32,32 @@ def template_file(tmp_path):
           </body>
         </html>
     """
-    )
+)
+
+
+@pytest.fixture(scope="module")
+def template_file(tmp_path_factory):
+    # Written once and only read; tests that overwrite it use writable_template_file
+    path = tmp_path_factory.mktemp("templates") / "sample-template.html"
+    path.write_text(_TEMPLATE_HTML, encoding="utf-8")
+    logger.info("Template written to %s", path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def readonly_injector(template_file):
+    # The tests using it only inject and save elsewhere, never touching the template
+    return Injector(template_file)
+
+
+@pytest.fixture
+def writable_template_file(tmp_path):
     path = tmp_path / "sample-template.html"
-    path.write_text(html_content, encoding="utf-8")
-    logger.info(f"Template written to {path}")
+    path.write_text(_TEMPLATE_HTML, encoding="utf-8")
     return path
 
 
-def test_inject_html(template_file, caplog):
+def test_inject_html(readonly_injector):
     html_to_inject = textwrap.dedent(
         """
         <div class="injected-section">
@@ -64,9 +82,7 @@ def test_inject_html(template_file, caplog):
       </div>
     </div>"""
 
-    caplog.set_level(logging.INFO)
-    injector = Injector(template_file)
-    result = injector.inject_html(html_to_inject, "my-publications")
+    result = readonly_injector.inject_html(html_to_inject, "my-publications")
 
     logger.info("Injection result:\n%s", result)
 
@@ -83,40 +99,211 @@ def test_inject_html(template_file, caplog):
         pytest.fail(f"Expected 1 injected section, but found {count}")
 
 
-def test_save_injected_html_as_creates_new_file(template_file, tmp_path, caplog):
-    injector = Injector(template_file)
+def test_save_injected_html_as_creates_new_file(readonly_injector, tmp_path, caplog):
+    injector = readonly_injector
     html_to_inject = "<p>Saved HTML</p>"
     output_path = tmp_path / "output.html"
 
     caplog.set_level(logging.INFO)
     injector.save_injected_html_as(html_to_inject, "my-publications", output_path)
 
-    assert output_path.exists(), "Output file was not created"
-    contents = output_path.read_text(encoding="utf-8")
-    assert "<p>Saved HTML</p>" in contents, "Injected content not found in saved file"
+    # read_bytes raises if the output file was not created
+    contents = output_path.read_bytes()
+    assert b"<p>Saved HTML</p>" in contents, "Injected content not found in saved file"
 
-    assert any(
-        f"Injected HTML saved to '{output_path}'" in message
-        for message in caplog.messages
-    ), "Expected log message not found for save operation"
+    expected = f"Injected HTML saved to '{output_path}'"
+    assert expected in caplog.text, "Expected log message not found for save operation"
 
 
-def test_replace_template_with_injected_html_overwrites_original(template_file, caplog):
-    injector = Injector(template_file)
+def test_replace_template_with_injected_html_overwrites_original(
+    writable_template_file, caplog
+):
+    injector = Injector(writable_template_file)
     html_to_inject = "<span>Overwritten HTML</span>"
 
-    original_content = template_file.read_text(encoding="utf-8")
+    original_content = writable_template_file.read_text(encoding="utf-8")
     assert "<span>Overwritten HTML</span>" not in original_content
 
     caplog.set_level(logging.INFO)
     injector.replace_template_with_injected_html(html_to_inject, "my-publications")
 
-    new_content = template_file.read_text(encoding="utf-8")
+    new_content = writable_template_file.read_text(encoding="utf-8")
     assert (
         "<span>Overwritten HTML</span>" in new_content
     ), "Original template was not updated"
 
-    assert any(
-        f"Replaced original file '{template_file}'" in message
-        for message in caplog.messages
+    expected = f"Replaced original file '{writable_template_file}'"
+    assert (
+        expected in caplog.text
     ), "Expected log message not found for replace operation"
+
+
+def test_inject_html_replaces_nested_divs():
+    template = textwrap.dedent(
+        """
+        <body>
+          <div class="page" id="refs">
+            <div class="old">
+              <p>Old entry</p>
+            </div>
+          </div>
+          <div id="footer"></div>
+        </body>
+        """
+    )
+    injector = Injector(template, is_path=False)
+    result = injector.inject_html("<p>New entry</p>", "refs")
+
+    logger.info("Injection result:\n%s", result)
+    assert "Old entry" not in result
+    assert (
+        '  <div class="page" id="refs">\n'
+        "    <p>New entry</p>\n"
+        "  </div>\n"
+        '  <div id="footer"></div>'
+    ) in result
+
+
+def test_inject_html_repeated_calls_reuse_div_bounds(template_file):
+    injector = Injector(template_file)
+
+    first = injector.inject_html("<p>First</p>", "my-publications")
+    second = injector.inject_html("<p>Second</p>", "my-publications")
+
+    assert list(injector._div_bounds) == ["my-publications"]
+    assert first.replace("First", "Second") == second
+    assert injector.html == template_file.read_text(encoding="utf-8")
+
+
+def test_inject_html_missing_id_fails_fast(template_file, caplog):
+    injector = Injector(template_file)
+
+    caplog.set_level(logging.ERROR)
+    result = injector.inject_html("<p>Nowhere</p>", "no-such-id")
+
+    assert result is None
+    assert "no-such-id" not in injector._div_bounds
+    assert any(
+        "HTMLElementNotFoundError" in message for message in caplog.messages
+    ), "Expected error log for a missing target id"
+
+
+def test_save_twice_reuses_injection(template_file, tmp_path):
+    injector = Injector(template_file)
+    html_to_inject = "<p>Saved twice</p>"
+
+    first_path = tmp_path / "first.html"
+    second_path = tmp_path / "second.html"
+    injector.save_injected_html_as(html_to_inject, "my-publications", first_path)
+    cached = injector._last_injection
+    injector.save_injected_html_as(html_to_inject, "my-publications", second_path)
+
+    assert injector._last_injection is cached
+    assert first_path.read_text(encoding="utf-8") == second_path.read_text(
+        encoding="utf-8"
+    )
+
+
+def test_inject_html_uses_first_div_across_quote_styles():
+    template = textwrap.dedent(
+        """
+        <body>
+          <div id='refs'></div>
+          <div id="refs"></div>
+        </body>
+        """
+    )
+    injector = Injector(template, is_path=False)
+    result = injector.inject_html("<p>Only once</p>", "refs")
+
+    logger.info("Injection result:\n%s", result)
+    assert result.count("Only once") == 1
+    assert (
+        "  <div id='refs'>\n"
+        "    <p>Only once</p>\n"
+        "  </div>\n"
+        '  <div id="refs"></div>'
+    ) in result
+
+
+def test_pipeline_reuses_arranged_entries_across_settings():
+    bib_text = textwrap.dedent(
+        """
+        @article{old, author={Doe, John}, title={Old}, journal={J}, year={2019}}
+        @article{new, author={Roe, Jane}, title={New}, journal={J}, year={2023}}
+        """
+    )
+    html_text = '<body>\n  <div id="a"></div>\n  <div id="b"></div>\n</body>\n'
+
+    def run(style, target_id):
+        return Injector.run_injection_pipeline(
+            html_text, bib_text, style, "desc", "year", target_id, "none"
+        )
+
+    injector_module._ARRANGED_CACHE.clear()
+    injector_module._PIPELINE_CACHE.clear()
+    run("apa", "a")
+    cache_key = (hashlib.blake2b(bib_text.encode("utf-8")).digest(), "year", True)
+    arranged = injector_module._ARRANGED_CACHE[cache_key]
+    reused = run("abnt", "b")
+
+    assert injector_module._ARRANGED_CACHE[cache_key] is arranged
+    assert all(bib_text not in key for key in injector_module._ARRANGED_CACHE)
+    injector_module._ARRANGED_CACHE.clear()
+    injector_module._PIPELINE_CACHE.clear()
+    assert reused == run("abnt", "b")
+    assert reused.index("2023") < reused.index("2019")
+
+
+def test_pipeline_returns_cached_output_for_same_inputs():
+    bib_text = "@misc{only, author={Doe, John}, title={Only}, year={2020}}"
+    html_text = '<body>\n  <div id="refs"></div>\n</body>\n'
+    args = (html_text, bib_text, "apa", "asc", None, "refs", "none")
+
+    injector_module._PIPELINE_CACHE.clear()
+    first = Injector.run_injection_pipeline(*args)
+    second = Injector.run_injection_pipeline(*args)
+    other = Injector.run_injection_pipeline(*args[:5], "nowhere", "none")
+
+    assert second is first
+    assert "Only" in first
+    assert other is None
+    assert len(injector_module._PIPELINE_CACHE) == 1
+
+
+def test_pipeline_reports_missing_entries_before_loading_style():
+    result = Injector.run_injection_pipeline(
+        '<div id="refs"></div>', "", None, None, None, "refs", "none"
+    )
+
+    assert result == "Error: No valid BibTeX entries found."
+
+
+@pytest.mark.parametrize(
+    "template, expected",
+    [
+        ("<a>\r\t<b>", "\t"),
+        ("<x>\n\r  <y>", "  "),
+        ("<x>\r\n    <y>", "    "),
+        ("<x>\n  \t<y>", "\t"),
+        ("<x>\n<y>", "  "),
+    ],
+)
+def test_indent_unit_follows_splitlines_boundaries(template, expected):
+    assert Injector(template, is_path=False)._indent_unit == expected
+
+
+def test_pipeline_logs_missing_style_template(caplog):
+    caplog.set_level(logging.ERROR)
+    result = Injector.run_injection_pipeline(
+        '<div id="refs"></div>',
+        "@misc{only, title={Only}, year={2020}}",
+        "nonexistent",
+        "desc",
+        None,
+        "refs",
+        "none",
+    )
+
+    assert result is None
+    assert "FileNotFoundError: File not found: refspec/nonexistent.html" in caplog.text
@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+import pytest
+from src import web
+
+logger = logging.getLogger(__name__)
+
+_TEMPLATE_HTML = (
+    '<html>\n  <body>\n    <div id="refs">\n    </div>\n  </body>\n</html>\n'
+)
+
+
+def _form(title="Only"):
+    return {
+        "htmltext": _TEMPLATE_HTML,
+        "bibtext": "@misc{only, author={Doe, John}, title={%s}, year={2020}}" % title,
+        "style": "apa",
+        "order": "desc",
+        "group": "",
+        "target_id": "refs",
+    }
+
+
+@pytest.fixture
+def client():
+    web._outputs.clear()
+    yield web.app.test_client()
+    web._outputs.clear()
+
+
+def test_inject_sets_session_cookie(client):
+    response = client.post("/inject", data=_form())
+
+    assert response.status_code == 200
+    cookie = client.get_cookie(web.SESSION_COOKIE)
+    assert cookie is not None and cookie.http_only
+    assert cookie.value in web._outputs
+
+
+def test_preview_serves_the_session_output(client):
+    assert client.get("/preview").data == b"<p>No output generated yet</p>"
+
+    client.post("/inject", data=_form())
+    preview = client.get("/preview")
+
+    logger.info("Preview:\n%s", preview.data.decode("utf-8"))
+    assert preview.mimetype == "text/html"
+    assert b"Only" in preview.data
+    assert b'<div id="refs">' in preview.data
+
+
+def test_sessions_are_isolated(client):
+    other = web.app.test_client()
+
+    client.post("/inject", data=_form("First"))
+    other.post("/inject", data=_form("Second"))
+
+    assert b"First" in client.get("/preview").data
+    assert b"Second" not in client.get("/preview").data
+    assert b"Second" in other.get("/preview").data
+    assert len(web._outputs) == 2
+
+
+def test_oldest_session_is_evicted(client, monkeypatch):
+    monkeypatch.setattr(web, "MAX_SESSIONS", 2)
+    clients = [web.app.test_client() for _ in range(3)]
+    for i, session_client in enumerate(clients):
+        session_client.post("/inject", data=_form(f"Title{i}"))
+
+    assert clients[0].get("/preview").data == b"<p>No output generated yet</p>"
+    assert b"Title1" in clients[1].get("/preview").data
+    assert b"Title2" in clients[2].get("/preview").data
+    assert len(web._outputs) == 2
+
+
+def test_download_prefers_session_bytes(client):
+    client.post("/inject", data=_form())
+    download = client.post("/download", data={"output": "<p>posted</p>"})
+
+    assert download.status_code == 200
+    assert download.data == client.get("/preview").data
+    assert download.headers["Content-Length"] == str(len(download.data))
+
+
+def test_download_falls_back_to_posted_output(client):
+    form_page = client.post("/inject", data=_form()).data.decode("utf-8")
+    assert 'name="output"' in form_page
+
+    # A fresh client has no session, as after a restart or on another instance
+    download = web.app.test_client().post(
+        "/download", data={"output": "<p>posted é</p>"}
+    )
+
+    assert download.status_code == 200
+    assert download.data == "<p>posted é</p>".encode("utf-8")
+    assert "output-injected.html" in download.headers["Content-Disposition"]
+
+
+def test_download_without_output_is_rejected(client):
+    assert client.post("/download").status_code == 400
+
+
+@pytest.fixture
+def held_pipeline(monkeypatch):
+    """Make jobs wait on an event and return a fixed result."""
+    release = threading.Event()
+    outcome = {"result": "<p>Job output</p>"}
+
+    def fake_pipeline(**kwargs):
+        release.wait(timeout=5)
+        return outcome["result"]
+
+    monkeypatch.setattr(
+        web.Injector, "run_injection_pipeline", staticmethod(fake_pipeline)
+    )
+    web._jobs.clear()
+    yield release, outcome
+    release.set()
+    web._jobs.clear()
+
+
+def _wait_for_job(client, job_id):
+    for _ in range(200):
+        status = client.get(f"/status/{job_id}").get_json()["status"]
+        if status != "pending":
+            return status
+        time.sleep(0.01)
+    raise AssertionError("Job did not finish")
+
+
+def test_job_runs_in_background(client, held_pipeline):
+    release, _ = held_pipeline
+
+    submitted = client.post("/jobs", data=_form())
+    assert submitted.status_code == 202
+    job_id = submitted.get_json()["id"]
+    assert submitted.get_json()["status"] == f"/status/{job_id}"
+
+    assert client.get(f"/status/{job_id}").get_json()["status"] == "pending"
+    assert client.get(f"/result/{job_id}").status_code == 409
+
+    release.set()
+    assert _wait_for_job(client, job_id) == "done"
+    result = client.get(f"/result/{job_id}")
+    assert result.status_code == 200
+    assert result.data == b"<p>Job output</p>"
+    assert client.get("/preview").data == b"<p>Job output</p>"
+
+
+def test_failed_job_is_reported(client, held_pipeline):
+    release, outcome = held_pipeline
+    outcome["result"] = None
+    release.set()
+
+    job_id = client.post("/jobs", data=_form()).get_json()["id"]
+
+    assert _wait_for_job(client, job_id) == "failed"
+    result = client.get(f"/result/{job_id}")
+    assert result.status_code == 500
+    assert b"Job failed" in result.data
+
+
+def test_unknown_job_is_not_found(client):
+    assert client.get("/status/no-such-job").status_code == 404
+    assert client.get("/result/no-such-job").status_code == 404
@@ -1,6 +1,23 @@
-from flask import Flask, render_template, request, send_file, jsonify, abort
-from typing import Dict
+from flask import (
+    Flask,
+    render_template,
+    request,
+    send_file,
+    jsonify,
+    abort,
+    make_response,
+)
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import gzip
+import hashlib
+import os
+import time
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Optional, Tuple
 from io import BytesIO
+from uuid import uuid4
 from werkzeug.utils import secure_filename
 
 from .data import UIData
@@ -8,23 +25,109 @@ from .injector import Injector
 from .error_handler import ErrorHandler
 
 
-last_output_html = ""
-ALLOWED_EXT = {"svg", "png", "jpg", "jpeg", "gif"}
+ALLOWED_EXT = frozenset(("svg", "png", "jpg", "jpeg", "gif"))
+UPLOAD_MAX_AGE = 86400
+MAX_UPLOAD_BYTES = 16 * 1024 * 1024
+SESSION_COOKIE = "bibinject_sid"
+MAX_SESSIONS = 128
+# Generated HTML is gzipped for clients that accept it, above this size
+COMPRESS_MIN_SIZE = 2048
+COMPRESS_LEVEL = 4
+# Fixed JSON error bodies, serialized once (same bytes jsonify produced)
+_ERR_INVALID_DOI_ICON = b'{"error":"Invalid DOI icon file type"}\n'
 
 
 app = Flask(__name__, template_folder="../templates", static_folder="../static")
+# Oversized uploads are refused with 413 before their body is read
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
 error_handler = ErrorHandler()
 
-in_memory_uploads: Dict[str, dict[str, bytes | str]] = {}
+in_memory_uploads: Dict[str, dict[str, bytes | str | float]] = {}
+
+# Latest (UTF-8 output, input_filename) per browser session, least recent
+# first. Only the encoded bytes are kept: /download sends them as they are and
+# /preview serves them directly, so each session holds one copy of its output.
+_outputs: "OrderedDict[str, Tuple[Optional[bytes], Optional[str]]]" = OrderedDict()
+_outputs_lock = Lock()
+
+# Background pipeline runs for /jobs, least recent first. The form keeps
+# using the synchronous /inject, which also works on serverless deployments.
+MAX_JOBS = 64
+_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_jobs_lock = Lock()
+
 
 def allowed_file(filename):
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXT
+    # rfind + slice reads the extension without rsplit's list
+    dot = filename.rfind(".")
+    return dot != -1 and filename[dot + 1 :].lower() in ALLOWED_EXT
+
+
+def _read_upload_text(field_name):
+    """Decode an uploaded file straight from its stream, or None if absent."""
+    upload = request.files.get(field_name)
+    if upload is None or not upload.filename:
+        return None
+    return upload.stream.read().decode("utf-8")
+
+
+def _store_output(sid, output_html, input_filename):
+    """Remember the latest output of session `sid`, evicting the oldest."""
+    encoded = output_html.encode("utf-8") if output_html else None
+    with _outputs_lock:
+        _outputs[sid] = (encoded, input_filename)
+        _outputs.move_to_end(sid)
+        while len(_outputs) > MAX_SESSIONS:
+            _outputs.popitem(last=False)
+
+
+def _load_output(sid):
+    """Return the (output bytes, input_filename) stored for `sid`, or None."""
+    if not sid:
+        return None
+    with _outputs_lock:
+        return _outputs.get(sid)
+
+
+@lru_cache(maxsize=1)
+def _job_pool() -> ThreadPoolExecutor:
+    """Worker pool for /jobs, created on the first job rather than at import."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+@lru_cache(maxsize=1)
+def _ui_data() -> UIData:
+    """UI values shared by every response; templates only read them."""
+    return UIData()
+
+
+@app.after_request
+def _compress_html(response):
+    """Gzip generated HTML responses; icons and downloads pass as-is."""
+    if (
+        request.endpoint not in ("inject_web", "preview", "job_result")
+        or response.status_code != 200
+        or response.mimetype != "text/html"
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @app.route("/", methods=["GET"])
 def index():
     """Landing page."""
-    data = UIData()  # load all UI values
+    data = _ui_data()  # load all UI values
     return render_template("web.html", data=data)
 
 
@@ -34,94 +137,184 @@ def serve_uploaded_file(filename):
     file_data = in_memory_uploads.get(filename)
     if not file_data:
         abort(404)
+    # Repeat views revalidate against the content hash and get a 304
     return send_file(
         BytesIO(file_data["bytes"]),
         mimetype=file_data["mimetype"],
         download_name=filename,
         as_attachment=False,
+        conditional=True,
+        etag=file_data["etag"],
+        last_modified=file_data["mtime"],
+        max_age=UPLOAD_MAX_AGE,
     )
 
 
-@app.route("/inject", methods=["POST"])
-def inject_web():
-    """Receive form data, run the inject pipeline, and return output HTML."""
-
-    global last_output_html, last_input_filename
+def _read_inject_form():
+    """
+    Read the inject form into run_injection_pipeline keyword arguments.
 
+    Returns:
+        tuple: (pipeline kwargs, uploaded HTML filename or None), or None if
+        the DOI icon has a disallowed file type.
+    """
     # Read HTML input (file or textarea)
-    html_text = ""
-    filename = None
-    if "htmlfile" in request.files and request.files["htmlfile"].filename:
-        file = request.files["htmlfile"]
-        filename = file.filename
-        html_text = file.read().decode("utf-8")
+    input_filename = None
+    html_text = _read_upload_text("htmlfile")
+    if html_text is not None:
+        input_filename = request.files["htmlfile"].filename
     else:
         html_text = request.form.get("htmltext", "")
 
-    last_input_filename = filename 
-
     # Read BibTeX input (file or textarea)
-    bib_text = ""
-    if "bibfile" in request.files and request.files["bibfile"].filename:
-        bib_text = request.files["bibfile"].read().decode("utf-8")
-    else:
+    bib_text = _read_upload_text("bibfile")
+    if bib_text is None:
         bib_text = request.form.get("bibtext", "")
 
-    # Other fields
-    style = request.form.get("style")
-    order = request.form.get("order")
-    group = request.form.get("group")
-    target_id = request.form.get("target_id")
-    
     doi_icon = "none"
     if "doifile" in request.files and request.files["doifile"].filename:
         file = request.files["doifile"]
         filename = secure_filename(file.filename)
 
-        if allowed_file(filename):
-            file_bytes = file.read()
-            mimetype = file.mimetype or "application/octet-stream"
-
-            # Save file in memory
-            in_memory_uploads[filename] = {
-                "bytes": file_bytes,
-                "mimetype": mimetype,
-            }
-            # Set path to serve later
-            doi_icon = f"/uploads/{filename}"
-        else:
-            return jsonify({"error": "Invalid DOI icon file type"}), 400
+        if not allowed_file(filename):
+            return None
+
+        file_bytes = file.read()
+        mimetype = file.mimetype or "application/octet-stream"
+
+        # Save file in memory
+        in_memory_uploads[filename] = {
+            "bytes": file_bytes,
+            "mimetype": mimetype,
+            "etag": hashlib.sha1(file_bytes).hexdigest(),
+            "mtime": time.time(),
+        }
+        # Set path to serve later
+        doi_icon = f"/uploads/{filename}"
+
+    error_handler.info("DOI icon path: %s", doi_icon)
+
+    pipeline_args = {
+        "html_text": html_text,
+        "bib_text": bib_text,
+        "style": request.form.get("style"),
+        "order": request.form.get("order"),
+        "group": request.form.get("group"),
+        "doi_icon": doi_icon,
+        "target_id": request.form.get("target_id"),
+    }
+    return pipeline_args, input_filename
+
+
+def _invalid_doi_icon_response():
+    return app.response_class(
+        _ERR_INVALID_DOI_ICON, status=400, mimetype="application/json"
+    )
 
-    error_handler.info(f"DOI icon path: {doi_icon}")
 
+@app.route("/inject", methods=["POST"])
+def inject_web():
+    """Receive form data, run the inject pipeline, and return output HTML."""
+    form = _read_inject_form()
+    if form is None:
+        return _invalid_doi_icon_response()
+    pipeline_args, input_filename = form
 
     # Run the processing pipeline
-    output_html = Injector.run_injection_pipeline(
-        html_text=html_text,
-        bib_text=bib_text,
-        style=style,
-        order=order,
-        group=group,
-        doi_icon=doi_icon,
-        target_id=target_id,
+    output_html = Injector.run_injection_pipeline(**pipeline_args)
+
+    # Kept per session so concurrent users never see each other's output
+    sid = request.cookies.get(SESSION_COOKIE) or uuid4().hex
+    _store_output(sid, output_html, input_filename)
+
+    data = _ui_data()
+    response = make_response(
+        render_template("web.html", data=data, output=output_html)
     )
+    response.set_cookie(SESSION_COOKIE, sid, httponly=True, samesite="Lax")
+    return response
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """Queue the inject pipeline for the form data and return its job id."""
+    form = _read_inject_form()
+    if form is None:
+        return _invalid_doi_icon_response()
+    pipeline_args, input_filename = form
+
+    sid = request.cookies.get(SESSION_COOKIE) or uuid4().hex
+    job_id = uuid4().hex
+
+    # A finished job becomes the session's output for /preview and /download,
+    # stored before the job reports done
+    def run():
+        output_html = Injector.run_injection_pipeline(**pipeline_args)
+        _store_output(sid, output_html, input_filename)
+        return output_html
+
+    future = _job_pool().submit(run)
+    with _jobs_lock:
+        _jobs[job_id] = future
+        while len(_jobs) > MAX_JOBS:
+            _jobs.popitem(last=False)
+
+    response = jsonify({"id": job_id, "status": f"/status/{job_id}"})
+    response.status_code = 202
+    response.set_cookie(SESSION_COOKIE, sid, httponly=True, samesite="Lax")
+    return response
+
+
+def _get_job(job_id):
+    with _jobs_lock:
+        future = _jobs.get(job_id)
+    if future is None:
+        abort(404)
+    return future
+
+
+def _job_state(future):
+    """Job state: pending, failed (raised or produced no output), or done."""
+    if not future.done():
+        return "pending"
+    if future.exception() is not None or future.result() is None:
+        return "failed"
+    return "done"
+
 
-    last_output_html = output_html
+@app.route("/status/<job_id>")
+def job_status(job_id):
+    """Report whether a queued job is pending, done, or failed."""
+    return jsonify({"id": job_id, "status": _job_state(_get_job(job_id))})
 
-    data = UIData()
-    return render_template("web.html", data=data, output=output_html)
+
+@app.route("/result/<job_id>")
+def job_result(job_id):
+    """Return a finished job's output HTML, or 409 while it is still running."""
+    future = _get_job(job_id)
+    state = _job_state(future)
+    if state == "pending":
+        return "Job still running.", 409
+    if state == "failed":
+        # The pipeline logs the cause; it returns None instead of raising
+        return "Job failed: the pipeline produced no output (see the log).", 500
+    return future.result()
 
 
 @app.route("/download", methods=["POST"])
 def download_output():
-    global last_input_filename
-
-    html_content = request.form.get("output")
-    if not html_content:
-        return "No output to download.", 400
+    stored = _load_output(request.cookies.get(SESSION_COOKIE))
+    payload = stored[0] if stored else None
+    if payload is None:
+        # Another instance, a restart or eviction lost the session output;
+        # the page posts its own copy, so the download still works
+        html_content = request.form.get("output")
+        if not html_content:
+            return "No output to download.", 400
+        payload = html_content.encode("utf-8")
 
     # If no file uploaded, use default name
-    input_name = last_input_filename or "output.html"
+    input_name = (stored[1] if stored else None) or "output.html"
 
     # Split extension safely
     if "." in input_name:
@@ -130,21 +323,25 @@ def download_output():
     else:
         output_name = input_name + "-injected.html"
 
-    buffer = BytesIO()
-    buffer.write(html_content.encode("utf-8"))
-    buffer.seek(0)
-
-    return send_file(
-        buffer, as_attachment=True, download_name=output_name, mimetype="text/html"
+    response = send_file(
+        BytesIO(payload),
+        as_attachment=True,
+        download_name=output_name,
+        mimetype="text/html",
     )
+    # In-memory bytes have no descriptor for the server's file wrapper to
+    # sendfile, so hand over the body as one block instead of 8 KB reads;
+    # downloads are never conditional or ranged, so the body stays whole
+    response.response = [payload]
+    return response
 
 
 @app.route("/preview")
 def preview():
-    global last_output_html
-    if not last_output_html:
+    stored = _load_output(request.cookies.get(SESSION_COOKIE))
+    if not stored or not stored[0]:
         return "<p>No output generated yet</p>"
-    return last_output_html
+    return app.response_class(stored[0], mimetype="text/html")
 
 
 def run_web(host="127.0.0.1", port=6969):